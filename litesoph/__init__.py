@@ -3,12 +3,11 @@
 
 from litesoph.common.ls_manager import LSManager
 from tkinter import messagebox
+from litesoph.version import __version__
 
 
 
 
-__version__ = '1.1'
-
 
 def about_litesoph():
     about_message = "Layer Integrated Toolkit and Engine for Simulations of Photo-induced Phenomena\n" + f"Version: {__version__}"
@@ -127,6 +127,17 @@ class LSManager:
     def save(self):
         if hasattr(self, 'project_manager'):
             self.project_manager.save()
+
+    def snapshot(self):
+        """Returns a snapshot of the current project data to be written later
+        by save_snapshot, or None if no project is open."""
+        if hasattr(self, 'project_manager'):
+            return self.project_manager, self.project_manager.snapshot()
+
+    def save_snapshot(self, snapshot):
+        """Writes a snapshot taken by snapshot. Safe to call from a worker thread."""
+        project_manager, data = snapshot
+        project_manager.write_snapshot(data)
         # for project in self.project_list:
         #     file = project.path / self.project_data_file_relative_path
         #     with open(file, 'w') as f:
@@ -2,7 +2,6 @@ from dataclasses import dataclass
 import pathlib
 import os
 import json
-from matplotlib import pyplot as plt
 import numpy as np
 from typing import Any, Dict
 from litesoph.common.data_sturcture.data_types import DataTypes as  DT
@@ -2,6 +2,8 @@ import shutil
 from typing import Any, Dict
 import uuid
 import copy
+import itertools
+import threading
 
 from pathlib import Path
 import os
@@ -29,6 +31,13 @@ class ProjectManager:
         the project.
     """
     
+    # Snapshots are numbered so that a write of an older snapshot, e.g. a
+    # background autosave finishing late, never overwrites newer data. Shared
+    # by all instances, as a reopened project gets a new ProjectManager.
+    _snapshot_seq = itertools.count(1)
+    _written_seq = {}
+    _write_lock = threading.Lock()
+
     def __init__(self, ls_manager, project_info: ProjectInfo) -> None:
         self.ls_manager = ls_manager
         self.project_info = project_info
@@ -193,14 +202,24 @@ class ProjectManager:
         pass
 
     def save(self):
+        self.write_snapshot(self.snapshot())
+
+    def snapshot(self):
+        """Returns the sequence number, the project data file and the project
+        info serialized to json."""
         file = self.project_path / self.ls_manager.project_data_file_relative_path
-        try:
-            json_txt = self.project_info.to_json()
-        except TypeError:
-            raise
-        
-        with open(file, 'w') as f:
-            f.write(json_txt)
+        return next(self._snapshot_seq), file, self.project_info.to_json()
+
+    def write_snapshot(self, snapshot):
+        """Writes a snapshot taken by snapshot() to the project data file, unless
+        a newer snapshot was already written. Safe to call from a worker thread."""
+        seq, file, json_txt = snapshot
+        with self._write_lock:
+            if seq < self._written_seq.get(file, 0):
+                return
+            with open(file, 'w') as f:
+                f.write(json_txt)
+            self._written_seq[file] = seq
 
     def remove(self, workflow_uuid):
         """This removes a workflow from the project. It will
@@ -1,6 +1,8 @@
 import pathlib
 import json
 import copy
+from functools import reduce
+from operator import getitem
 
 
 class Status():
@@ -48,30 +50,25 @@ class Status():
             for key, value in data_dict.items():
                 self.status_dict[key] = value
             
-    def update(self, path:str , value):
+    def update(self, path , value):
         """ updates the status dictionary and writes to json file
-         if path(string of keys separated by '.') and value are given"""
+         if path(tuple of keys or string of keys separated by '.') and value are given"""
 
-        keys = path.split('.')
-        recursive_update(keys, value, self.status_dict)
+        recursive_update(_path_keys(path), value, self.status_dict)
         self.save()
 
-    def get(self, path:str):
+    def get(self, path):
         """returns the value from the nested dictionary 
-        with path(string of keys separated by '.')"""
+        with path(tuple of keys or string of keys separated by '.')"""
 
         self.read()
         try:
-            obj = dict(self.status_dict)
-            list = path.split('.')
-            for key in list:
-                obj = obj[key]   
-            return obj
+            return reduce(getitem, _path_keys(path), self.status_dict)
         except KeyError:
             raise KeyError("Key not found")  
 
     def check(self, path, value):
-        """ returns boolean value if given path(keys separated by '.') and value match"""
+        """ returns boolean value if given path(see get) and value match"""
 
         try:
             if self.get(path) == value:
@@ -97,14 +94,16 @@ class Status():
             except TypeError:
                 raise   
 
-def recursive_update(keys :list, value, status_dict: dict):
-            
-    length = len(keys)
-    key = keys.pop(0)
-    if length == 1:
-        status_dict[key] = value
-    else: 
-        recursive_update(keys, value, status_dict[key])
+def _path_keys(path):
+    """Returns the keys of a status path given as a tuple or a '.' separated string."""
+    if isinstance(path, str):
+        return path.split('.')
+    return path
+
+def recursive_update(keys, value, status_dict: dict):
+    """Sets status_dict[keys[0]]...[keys[-1]] to value."""
+    *parents, key = keys
+    reduce(getitem, parents, status_dict)[key] = value
 
 class file_check:
     def __init__(self, check_list:list, dir) -> None:
@@ -1,11 +1,10 @@
 from typing import List, Any, Union
 import pathlib
-import re
 import os
+import uuid
 from abc import abstractmethod
 from litesoph.common.job_submit import SubmitNetwork, SubmitLocal
 from litesoph.common.data_sturcture.data_classes import TaskInfo
-import uuid
 
 class TaskError(RuntimeError):
     """Base class of error types related to any TASK."""
@@ -74,8 +73,6 @@ class Task:
         that this task is dependent on.
         """
     
-    id=str(uuid.uuid4())
-    BASH_filename = f'ls_job_script_{id}.sh'
     job_script_first_line = "#!/bin/bash"
     remote_job_script_last_line = "touch Done"
 
@@ -87,29 +84,35 @@ class Task:
         
         self.lsconfig = lsconfig
         self.task_info = task_info
+        # Each task gets its own job script so that concurrent tasks
+        # never overwrite each other's script.
+        self.id = uuid.uuid4().hex
+        self.BASH_filename = f'ls_job_script_{self.id}.sh'
         self.task_name = task_info.name
         self.dependent_tasks = dependent_tasks       
         self.directory = task_info.path
         # self.project_dir is deprecated and should be removed.
         self.project_dir = self.directory     
         self.engine_name = task_info.engine
-        self.engine_path = self.lsconfig['engine'].get(self.engine_name , self.engine_name)
-        mpi_path = self.lsconfig['mpi'].get('mpirun', 'mpirun')
-        self.mpi_path = self.lsconfig['mpi'].get(f'{self.engine_name}_mpi', mpi_path)
+        self._resolve_paths(lsconfig)
         self.python_path = self.lsconfig['programs'].get('python', 'python')
         self.submit_local = None
         self.submit_network = None
     
     def reset_lsconfig(self, lsconfig):
-        self.engine_path = lsconfig['engine'].get(self.engine_name , self.engine_name)
-        mpi_path = lsconfig['mpi'].get('mpirun', 'mpirun')
-        self.mpi_path = lsconfig['mpi'].get(f'{self.engine_name}_mpi', mpi_path)
+        self._resolve_paths(lsconfig)
+
+    def _resolve_paths(self, lsconfig):
+        """Sets the engine and mpi executable paths from lsconfig."""
+        engine_cfg = lsconfig['engine']
+        mpi_cfg = lsconfig['mpi']
+        self.engine_path = engine_cfg.get(self.engine_name, self.engine_name)
+        mpi_path = mpi_cfg.get('mpirun', 'mpirun')
+        self.mpi_path = mpi_cfg.get(f'{self.engine_name}_mpi', mpi_path)
 
     @staticmethod
     def create_directory(directory):
-        absdir = os.path.abspath(directory)
-        if absdir != pathlib.Path.cwd and not pathlib.Path.is_dir(directory):
-            os.makedirs(directory)
+        os.makedirs(directory, exist_ok=True)
 
     @abstractmethod
     def create_template(self):
@@ -164,7 +167,7 @@ class Task:
         if job_script:
             self.job_script = job_script
         self.bash_file = self.directory / self.BASH_filename
-        with open(self.bash_file, 'w+') as f:
+        with open(self.bash_file, 'w') as f:
             f.write(self.job_script)
 
     def add_proper_path(self, path):
@@ -176,10 +179,14 @@ class Task:
         if not template:
             return
 
-        if str(self.directory.parent.parent) in template:
-            text = re.sub(str(self.directory.parent.parent), str(path), template)
-            self.task_info.input['engine_input']['data'] = text        
-            self.write_input()
+        local_path = str(self.directory.parent.parent)
+        if local_path not in template:
+            return
+        text = template.replace(local_path, str(path))
+        if text == template:
+            return
+        self.task_info.input['engine_input']['data'] = text
+        self.write_input()
 
     def set_submit_local(self, *args):
         self.submit_local = SubmitLocal(self, *args)
@@ -202,9 +209,7 @@ class Task:
         pass
     
     def read_log(self, file):
-        with open(file , 'r') as f:
-            text = f.read()      
-        return text
+        return read_text_file(file)
         
     def check_output(self):
         
@@ -216,6 +221,12 @@ class Task:
             raise TaskFailed("Job not completed.")
         return True
 
+def read_text_file(path) -> str:
+    """Reads the whole of a text file in one call, for engine logs and outputs."""
+    with open(path, 'r') as f:
+        return f.read()
+
+
 def write2file(directory,filename, template) -> None:
     """Write template to a file.
     
@@ -228,66 +239,54 @@ def write2file(directory,filename, template) -> None:
     """
 
     filename = pathlib.Path(directory) / filename
-    file_exists = os.access(filename, os.F_OK)
-    parent_writeable = os.access(filename.parent, os.W_OK)
-    file_writeable = os.access(filename, os.W_OK)
-    
-    if ((not file_exists and not parent_writeable) or
-        (file_exists and not file_writeable)):
+    try:
+        with open(filename, 'w') as f:
+            f.write(template)
+    except PermissionError as e:
         msg = f'Permission denied acessing file: {filename}'
-        raise PermissionError(msg)
-
-    with open(filename, 'w+') as f:
+        raise PermissionError(msg) from e
 
-        f.truncate()
-        f.seek(0)
-        f.write(template)
 
-
-def assemable_job_cmd(job_id: str= '', engine_cmd:str = None, np: int =1, cd_path: str=None, 
-                        mpi_path: str = None,
-                        remote : bool = False,
-                        scheduler_block : str = None,
-                        module_load_block : str = None,
-                        extra_block : str = None) -> str:
-    job_script_first_line = "#!/bin/bash"
-    remote_job_script_last_line = "## DO NOT REMOVE LINE BELOW\n" + f"touch Done_{job_id}"
-    
-    job_script = [job_script_first_line]
+def _iter_job_script_lines(job_id, engine_cmd, np, cd_path, mpi_path,
+                           remote, scheduler_block, module_load_block, extra_block):
+    """Yields the lines of the job script in order."""
+    yield "#!/bin/bash"
     
     if remote:
         if scheduler_block:
-            job_script.append(scheduler_block)
+            yield scheduler_block
         if module_load_block:
-            job_script.append(module_load_block)
+            yield module_load_block
 
     if cd_path:
-        job_script.append(f'cd {cd_path};')
-        job_script.append("## DO NOT REMOVE LINE BELOW\n" + f'touch Start_{job_id}')
+        yield f'cd {cd_path};'
+        yield "## DO NOT REMOVE LINE BELOW\n" + f'touch Start_{job_id}'
         
     if engine_cmd:
         if np and np > 1:
-            if not mpi_path:
-                mpi_path = 'mpirun'
-            job_script.append(f'{mpi_path} -np {np:d} {engine_cmd}')
+            yield f'{mpi_path or "mpirun"} -np {np:d} {engine_cmd}'
         else:
-            job_script.append(f"{engine_cmd}")
-            # job_script.append(engine_cmd)
+            yield f"{engine_cmd}"
 
     if extra_block:
-        job_script.append(extra_block)
+        yield extra_block
 
     if remote:
-        job_script.append(remote_job_script_last_line)
-    
-    job_script = '\n'.join(job_script)
-    return job_script
+        yield "## DO NOT REMOVE LINE BELOW\n" + f"touch Done_{job_id}"
 
 
-def pbs_job_script(name):
+def assemable_job_cmd(job_id: str= '', engine_cmd:str = None, np: int =1, cd_path: str=None, 
+                        mpi_path: str = None,
+                        remote : bool = False,
+                        scheduler_block : str = None,
+                        module_load_block : str = None,
+                        extra_block : str = None) -> str:
+    return '\n'.join(_iter_job_script_lines(job_id, engine_cmd, np, cd_path, mpi_path,
+                                            remote, scheduler_block, module_load_block,
+                                            extra_block))
 
-    head_job_script = f"""
-#!/bin/bash
+
+_PBS_TEMPLATE = """#!/bin/bash
 #PBS -N {name}
 #PBS -o output.txt
 #PBS -e error.txt
@@ -296,5 +295,7 @@ def pbs_job_script(name):
 #PBS -l walltime=00:30:00
 #PBS -V
 cd $PBS_O_WORKDIR
-   """
-    return head_job_script
\ No newline at end of file
+"""
+
+def pbs_job_script(name):
+    return _PBS_TEMPLATE.format_map({'name': name})
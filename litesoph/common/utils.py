@@ -31,21 +31,22 @@ def create_dir(project_path):
 
 def get_new_directory(path:Path) -> Path:
     """Checks if the directory exists and addeds a number to name untill
-    a new name is found."""
-    parent = path.parent
+    a new name is found. The parent directory is listed once instead of
+    checking every candidate name on the filesystem."""
+    path = Path(path)
     name = path.name
+    try:
+        with os.scandir(path.parent) as entries:
+            taken = {entry.name for entry in entries if entry.name.startswith(name)}
+    except FileNotFoundError:
+        return path
+
+    if name not in taken:
+        return path
     i = 1
-    while True:
-        if path.exists():
-            if i == 1:
-                name = name + f'{i}'
-            else:    
-                name = name[:-(len(str(i)))] + f'{i}'
-            path = parent / name
-            i += 1
-        else:
-            break
-    return path
+    while f'{name}{i}' in taken:
+        i += 1
+    return path.parent / f'{name}{i}'
 
 #----------------------------------------------
 def get_pol_list(pol_var:str):
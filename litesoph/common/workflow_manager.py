@@ -446,8 +446,8 @@ def copy_task_files(source ,file_list, destination):
     workflow_path = Path(source)
     destination_path = Path(destination)
     for path in file_list:
-        s_path = Path.joinpath(workflow_path, path)
-        d_path = Path.joinpath(destination_path, path)
+        s_path = workflow_path / path
+        d_path = destination_path / path
         sub_path = destination_path
         for part in Path(path).parent.parts:
             sub_path = sub_path / part
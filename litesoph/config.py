@@ -6,6 +6,8 @@ import platform
 
 user_data_dir = pathlib.Path.home() / ".litesoph"
 
+user_cache_dir = pathlib.Path(os.environ.get("XDG_CACHE_HOME") or pathlib.Path.home() / ".cache") / "litesoph"
+
 config_file = user_data_dir / "lsconfig.ini"
 
 
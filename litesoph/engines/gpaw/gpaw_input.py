@@ -97,20 +97,25 @@ calc.write('{gpw_out}', mode='all')
 gs_template_with_box_dim = gs_template[0] + gs_template[1] + gs_template[3]
 gs_template = gs_template[0] + gs_template[2] + gs_template[3]
 
+def _add_restart_line(template):
+    tlines = template.splitlines()
+    tlines.insert(11, "restart ='{gpw_out}',")
+    return """\n""".join(tlines)
+
+# The restart variants only depend on the templates, so build them once.
+gs_restart_template = _add_restart_line(gs_template)
+gs_restart_template_with_box_dim = _add_restart_line(gs_template_with_box_dim)
+
 def formate_gs(kwargs):
     
     gs_dict = copy.deepcopy(default_param)
     gs_dict.update(kwargs)
-    if gs_dict.get('box_dim', None):
-        template = copy.deepcopy(gs_template_with_box_dim)
-    else:
-        template = copy.deepcopy(gs_template)
     restart = kwargs.get('restart', False)
 
-    if restart:
-        tlines = template.splitlines()
-        tlines.insert(11, "restart ='{gpw_out}',")
-        template = """\n""".join(tlines)
+    if gs_dict.get('box_dim', None):
+        template = gs_restart_template_with_box_dim if restart else gs_template_with_box_dim
+    else:
+        template = gs_restart_template if restart else gs_template
 
     template = template.format(**kwargs)
     return template
@@ -294,18 +299,21 @@ task_map = {
     tt.MO_POPULATION: mo_population
 }
 
+laser_import_lines = (
+    "from gpaw.lcaotddft.laser import GaussianPulse",
+    "from gpaw.external import ConstantElectricField"
+)
+
+masked_import_lines = (
+    "from litesoph.pre_processing.gpaw.external_mask import MaskedElectricField",
+    "from litesoph.pre_processing.gpaw.dipolemomentwriter_mask import DipoleMomentWriter"
+)
+
 def generate_laser_text(lasers):
     eps = 1e-6 #lower threshold for time origin, switches to Delta Pulse after that
-    lines = [
-        "from gpaw.lcaotddft.laser import GaussianPulse",
-        "from gpaw.external import ConstantElectricField"
-    ]
-    masked_import_lines = [
-        "from litesoph.pre_processing.gpaw.external_mask import MaskedElectricField",
-        "from litesoph.pre_processing.gpaw.dipolemomentwriter_mask import DipoleMomentWriter"
-    ]
-    td_line = ['td_potential = ', '[']
-    mask_list_line = ['masks = [']
+    lines = list(laser_import_lines)
+    td_entries = []
+    mask_entries = []
     len_masks = 0
     for i, laser in enumerate(lasers):
 
@@ -317,35 +325,30 @@ def generate_laser_text(lasers):
             pass
         if laser['type'] == 'gaussian':
             import_str = "from gpaw.lcaotddft.laser import GaussianPulse"
-            lines.append(f"pulse_{str(i)} = GaussianPulse({laser['strength']},{laser['time0']},{laser['frequency']},{sigma_freq}, 'sin')")
+            lines.append(f"pulse_{i} = GaussianPulse({laser['strength']},{laser['time0']},{laser['frequency']},{sigma_freq}, 'sin')")
         elif laser['type'] == 'delta':
             import_str = "from litesoph.pre_processing.laser_design import DeltaPulse"
-            lines.append(f"pulse_{str(i)} = DeltaPulse({laser['strength']},{round(laser['time0'])})")
+            lines.append(f"pulse_{i} = DeltaPulse({laser['strength']},{round(laser['time0'])})")
 
         add_import_line(lines, import_str)
         
         # mask dict for each laser
         
         if laser.get('mask', None) is None:
-            lines.append(f"ext_{str(i)} = ConstantElectricField(Hartree / Bohr,{laser['polarization']} )")
+            lines.append(f"ext_{i} = ConstantElectricField(Hartree / Bohr,{laser['polarization']} )")
         else:
-            lines.append(f"mask_{str(i)} = {laser['mask']}")
+            lines.append(f"mask_{i} = {laser['mask']}")
             len_masks += 1
             for line in masked_import_lines:
                 add_import_line(lines, line)
             # replacing ConstantElectricField with MaskedElectricField
-            lines.append(f"ext_{str(i)} = MaskedElectricField(Hartree / Bohr,{laser['polarization']}, mask = mask_{str(i)} )")
-            mask_list_line.append(f"ext_{str(i)}.mask,")
+            lines.append(f"ext_{i} = MaskedElectricField(Hartree / Bohr,{laser['polarization']}, mask = mask_{i} )")
+            mask_entries.append(f"ext_{i}.mask,")
 
-        td_line.append(f"{{'ext': ext_{str(i)}, 'laser': pulse_{str(i)}}},")
-        
-    mask_list_line.append(']')
-    mask_list_line = ''.join(mask_list_line)
-    td_line.append(']')
-    td_line = ''.join(td_line)
+        td_entries.append(f"{{'ext': ext_{i}, 'laser': pulse_{i}}},")
 
-    lines.append(mask_list_line)
-    lines.append(td_line)
+    lines.append(f"masks = [{''.join(mask_entries)}]")
+    lines.append(f"td_potential = [{''.join(td_entries)}]")
 
     return lines, len_masks
 
@@ -370,8 +373,8 @@ def assemable_rt(**kwargs):
         if restart:
             lines.pop(6)
         else:
-            lines[4:4] = generate_laser_text(lasers)[0]
-            len_masks = generate_laser_text(lasers)[1]
+            laser_lines, len_masks = generate_laser_text(lasers)
+            lines[4:4] = laser_lines
         template = '\n'.join(lines)
  
     else:   
@@ -143,7 +143,7 @@ class GpawTask(Task):
                 param['number_of_steps'] = param['number_of_steps'] - previous_steps 
 
             else:
-                param['gfilename'] = str(Path.joinpath(self.relative_path, self.dependent_tasks[0].output.get('gpw_out')))
+                param['gfilename'] = str(self.relative_path / self.dependent_tasks[0].output.get('gpw_out'))
             
             self.task_info.task_data['td_number_of_steps'] = param.get('number_of_steps')
             # TODO: add dm files
@@ -178,16 +178,16 @@ class GpawTask(Task):
 
         if tt.TCM == self.task_name:
 
-            param['gfilename'] = str(Path.joinpath(self.relative_path, self.dependent_tasks[0].output.get('gpw_out')))
-            param['wfile'] = str(Path.joinpath(self.relative_path, self.dependent_tasks[1].output.get('wfile')))
+            param['gfilename'] = str(self.relative_path / self.dependent_tasks[0].output.get('gpw_out'))
+            param['wfile'] = str(self.relative_path / self.dependent_tasks[1].output.get('wfile'))
             return
 
         if 'mo_population' ==self.task_name:
 
             gs_log = self.dependent_tasks[0].output.get('txt_out')
             gs_file = self.dependent_tasks[0].output.get('gpw_out')
-            param['gfilename'] = str(Path.joinpath(self.relative_path,  gs_file))
-            param['wfile'] = str(Path.joinpath(self.relative_path, self.dependent_tasks[1].output.get('wfile')))
+            param['gfilename'] = str(self.relative_path / gs_file)
+            param['wfile'] = str(self.relative_path / self.dependent_tasks[1].output.get('wfile'))
             
             param['mopop_file'] = mo_pop_file ='mo_population.dat'
             self.mo_populationfile = self.task_dir / mo_pop_file
@@ -208,7 +208,7 @@ class GpawTask(Task):
         
         infile = str(self.directory /self.task_info.input['engine_input']['path'])
         template = self.task_info.input['engine_input']['data']
-        with open(infile , 'w+') as f:
+        with open(infile , 'w') as f:
             f.write(template)
 
     def read_results(self):
@@ -419,7 +419,8 @@ def update_td_input(param):
         param['laser'] = laser_list
     
     else:
-        param['absorption_kick'] = [ p * param['strength'] for p in param['polarization']]
+        strength = param['strength']
+        param['absorption_kick'] = [p * strength for p in param['polarization']]
     
     param['propagate'] = (param['time_step'], param['number_of_steps'])
     param['analysis_tools'] = tools = []
@@ -1,11 +1,42 @@
 from litesoph.engines.nwchem.nwchem_input import nwchem_create_input
-from litesoph.engines.nwchem.nwchem_read_rt import nwchem_rt_parser
+from dataclasses import dataclass
+from litesoph.engines.nwchem.nwchem_read_rt import (nwchem_rt_parser, check_args_determine_labels,
+                                                    find_labelled_lines, parse_input)
 from litesoph.post_processing.mo_population import extract_pop_window
 import subprocess
 import pathlib
 import os
 import numpy as np
 
+def _parse_eigen_lines(lines):
+    """Reads the first orbital table (Vector, Occupation, Eigenvalue, ...) from output lines."""
+    labels = ['Vector','Occupation', 'Eigenvalue']
+    data = []
+    check = False
+    for line in lines:
+
+        if all(tag in line for tag in labels):
+            check = True
+            continue
+
+        if check:
+            if '------' in line:
+                continue
+
+            vals = line.strip().split()
+            if not vals:
+                break
+            data.append([float(val) for val in vals])
+    return data
+
+
+@dataclass
+class NwchemTDOutput:
+    """Data read from an NWChem RT-TDDFT output in a single pass."""
+    eigen: np.ndarray
+    moocc: np.ndarray
+
+
 class NWChem:
 
     def __init__(self,infile=None, outfile=None, 
@@ -41,12 +72,10 @@ class NWChem:
         restart_dir = self.parameters.get('perm', self.label)
         scratch_dir = self.parameters.get('scratch', restart_dir)
         
-        for dir in [self.directory/ restart_dir, self.directory / scratch_dir]:
-            
-            if dir != pathlib.Path.cwd() and not pathlib.Path(dir).is_dir():
-                os.makedirs(dir)
+        for dir in {self.directory/ restart_dir, self.directory / scratch_dir}:
+            os.makedirs(dir, exist_ok=True)
 
-        with open(infile , 'w+') as f:
+        with open(infile , 'w') as f:
             f.write(self.template)
 
     def run(self):
@@ -89,27 +118,23 @@ class NWChem:
         if not td_out_file:
             td_out_file = str(self.directory / self.outfile)
 
-        labels = ['Vector','Occupation', 'Eigenvalue']
         with open(td_out_file, 'r') as f:
             lines = f.readlines()
+        return _parse_eigen_lines(lines)
 
-        data = []
-        check = False
-        for line in lines:
+    def parse_td(self, td_out_file=None, tag='<rt_tddft>') -> NwchemTDOutput:
+        """Reads the orbital table and the MO occupations from the TD output at once."""
 
-            if all([tag in line for tag in labels]):
-                check = True
-                continue
+        if not td_out_file:
+            td_out_file = str(self.directory / self.outfile)
 
-            if check:
-                if '------' in line:
-                    continue
+        with open(td_out_file, 'r') as f:
+            text = f.read()
 
-                vals = line.strip().split()
-                if not vals:
-                    break
-                data.append([float(val) for val in vals])
-        return data
+        td_dict = check_args_determine_labels(dict(tag=tag, target='moocc'))
+        moocc = parse_input(td_dict, find_labelled_lines(text, td_dict['labels']))
+        return NwchemTDOutput(eigen=np.asarray(_parse_eigen_lines(text.split('\n'))),
+                            moocc=np.asarray(moocc))
 
     def get_td_moocc(self, popl_file,
                         td_out_file=None, 
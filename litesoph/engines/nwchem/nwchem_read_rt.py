@@ -8,7 +8,7 @@ def parse_input(td_dict, lines):
 
     data = []
     for l in lines:
-        if all ([tag in l for tag in labels]):
+        if all(tag in l for tag in labels):
             try:
                 vals = l.strip().split('#')[0].split()
             except:
@@ -29,7 +29,16 @@ def parse_input(td_dict, lines):
          
     return data
 
-    
+
+def find_labelled_lines(text, labels):
+    """Returns the lines of text that contain every label.
+
+    The rarest label is tested first, so most lines are rejected by a
+    single substring check."""
+    labels = sorted(labels, key=text.count)
+    anchor, rest = labels[0], labels[1:]
+    return [l for l in text.split('\n') if anchor in l and all(tag in l for tag in rest)]
+
 def postprocess_check(write, args, data):
     
     tprev = -9999.0
@@ -51,28 +60,34 @@ def postprocess_check(write, args, data):
 
     return data
 
-def write_td_output(write, data, td_dict):
+def format_td_output(data, td_dict):
     pol = td_dict.get('polarization') 
     target = td_dict.get('target')
     
+    lines = []
     if target != 'moocc':
   
-        write("#\n")
-        write("#-----------------------------------------\n")
+        lines.append("#\n")
+        lines.append("#-----------------------------------------\n")
         
         if pol:
             tag = target + '_' + pol[0]
-            write("#   Time [au]        {0} [au]         \n".format(tag))
+            lines.append("#   Time [au]        {0} [au]         \n".format(tag))
         else:
             tag = [f'{target}_x', f'{target}_y', f'{target}_z']
-            write("#   Time [au]        {} [au]         {} [au]         {} [au]\n".format(*tag))
+            lines.append("#   Time [au]        {} [au]         {} [au]         {} [au]\n".format(*tag))
         
-        write("#-----------------------------------------\n")
-        write("#\n")
+        lines.append("#-----------------------------------------\n")
+        lines.append("#\n")
 
-    for d in data:
-        txt = "     {: .10e}" * len(d) + '\n'
-        write(txt.format(*d))
+    if data:
+        txt = "     {: .10e}" * len(data[0]) + '\n'
+        lines.extend(txt.format(*d) for d in data)
+
+    return ''.join(lines)
+
+def write_td_output(write, data, td_dict):
+    write(format_td_output(data, td_dict))
 
 
 def check_args_determine_labels(td_dict):
@@ -161,41 +176,35 @@ def nwchem_rt_parser(td_out_file, outfile=None, tag='<rt_tddft>',
                     polarization=polarization,
                     zero=zero)
 
-    if outfile:
-        f = open(outfile, 'w')
-        write = f.write
-    else:
-        write = p
-
     td_dict = check_args_determine_labels(td_dict)
 
     try:
         with open(td_out_file, 'r') as f:
-            lines = f.readlines()
+            text = f.read()
     except:
         raise Exception(f'Failed to read in data from file: {td_out_file}')
     
-    data = parse_input(td_dict, lines)
+    data = parse_input(td_dict, find_labelled_lines(text, td_dict['labels']))
 
     if retrun_data:
         return data
 
-    write("#======================================\n")
-    write("#  NWChem Real-time TDDFT output parser\n")
-    write("#======================================\n")
-    write("# \n")
-    
-    write("# ------\n")
-    write('# Filename: "{0}"\n'.format(td_out_file))
-    write("#-------\n")
-
-    write("# Number of data points: {0}\n".format(len(data)))
-    write("# Time range: [{0}: {1}]\n".format(data[0][0], data[-1][0]))
-
-    write_td_output(write, data, td_dict)
+    header = ("#======================================\n"
+              "#  NWChem Real-time TDDFT output parser\n"
+              "#======================================\n"
+              "# \n"
+              "# ------\n"
+              '# Filename: "{0}"\n'
+              "#-------\n"
+              "# Number of data points: {1}\n"
+              "# Time range: [{2}: {3}]\n").format(td_out_file, len(data), data[0][0], data[-1][0])
+    text = header + format_td_output(data, td_dict)
 
     if outfile:
-        f.close()
+        with open(outfile, 'w') as f:
+            f.write(text)
+    else:
+        p(text)
 
 def main ():
 
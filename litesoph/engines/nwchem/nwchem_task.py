@@ -1,12 +1,19 @@
 from typing import List, Dict, Union
 from abc import abstractmethod
+from concurrent.futures import ProcessPoolExecutor
 import copy
+import multiprocessing
+from functools import lru_cache
+import hashlib
+import os
 import pathlib
 from pathlib import Path
+from litesoph.config import user_cache_dir
 from litesoph.utilities.units import as_to_au
+from litesoph.version import __version__
 from litesoph.common.utils import get_new_directory
 from litesoph.common.data_sturcture.data_classes import TaskInfo
-from litesoph.post_processing.mo_population import calc_population_diff, get_energy_window, get_occ_unocc
+from litesoph.post_processing.mo_population import calc_population_diff, extract_pop_window, get_energy_window, get_occ_unocc
 from litesoph.common.task import InputError, Task, TaskFailed, TaskNotImplementedError, assemable_job_cmd
 from litesoph.common.task_data import TaskTypes as tt
 from litesoph.engines.nwchem.nwchem import NWChem
@@ -58,6 +65,18 @@ nwchem_data = {
 'restart': 'nwchem/restart'
 }
 
+def _fast_param_copy(param):
+    """Copies the nested dicts, lists and tuples of a task parameter tree.
+    Leaf values are shared, which is enough since the engine setup only
+    rebinds keys and never mutates the leaves in place."""
+    if isinstance(param, dict):
+        return {key: _fast_param_copy(value) for key, value in param.items()}
+    if isinstance(param, list):
+        return [_fast_param_copy(value) for value in param]
+    if isinstance(param, tuple):
+        return tuple(_fast_param_copy(value) for value in param)
+    return param
+
 class BaseNwchemTask(Task):
 
     NAME = 'nwchem'
@@ -73,7 +92,7 @@ class BaseNwchemTask(Task):
         super().__init__(lsconfig, task_info, dependent_tasks)
         
         self.task_data = nwchem_data.get(self.task_name)
-        param = copy.deepcopy(self.task_info.param)
+        param = _fast_param_copy(self.task_info.param)
         
         self.user_input = param
 
@@ -176,11 +195,12 @@ class NwchemTask(BaseNwchemTask):
         self.infile = file_name + infile_ext
         self.outfile = file_name + outfile_ext
         self.task_info.input['engine_input']={}
+        rel_task_dir = self.task_dir.relative_to(self.directory)
 
         if restart:
-            self.task_info.output[f'txt_out{nrestart}'] = str(self.task_dir.relative_to(self.directory) / self.outfile)
+            self.task_info.output[f'txt_out{nrestart}'] = str(rel_task_dir / self.outfile)
         else:
-            self.task_info.output['txt_out'] = str(self.task_dir.relative_to(self.directory) / self.outfile)
+            self.task_info.output['txt_out'] = str(rel_task_dir / self.outfile)
         
         
         if self.task_name == tt.GROUND_STATE:
@@ -190,28 +210,17 @@ class NwchemTask(BaseNwchemTask):
         param['geometry'] = '../../coordinate.xyz'
         
         self.task_info.local_copy_files.extend(['coordinate.xyz',
-                                                str(self.task_dir.relative_to(self.directory).parent / 'restart')])
+                                                str(rel_task_dir.parent / 'restart')])
         if self.task_name == tt.RT_TDDFT:
             param['restart_kw'] = 'restart'
             param['basis'] =self.dependent_tasks[0].engine_param.get('basis')
             update_td_param(param)
 
-        self.task_info.input['engine_input']['path'] = str(self.task_dir.relative_to(self.directory) / self.infile)
+        self.task_info.input['engine_input']['path'] = str(rel_task_dir / self.infile)
         
         self.nwchem = NWChem(infile= self.infile, outfile=self.outfile, 
                             label=label, directory=self.task_dir, **param)
-            
 
-    def write_input(self,):
-        if not self.task_dir.exists():
-            self.create_directory(self.task_dir)
-        template = self.task_info.input['engine_input']['data']
-        self.nwchem.write_input(template)
-
-    def create_template(self):
-        template = self.nwchem.create_input()
-        self.task_info.engine_param.update(self.user_input)
-        self.task_info.input['engine_input']['data'] = template
 
     def extract_mo_population(self):
         self.below_homo = below_homo = self.user_input['num_occupied_mo']
@@ -221,14 +230,23 @@ class NwchemTask(BaseNwchemTask):
         td_out = str(self.directory / self.dependent_tasks[1].output.get('txt_out'))
 
         #self.energy_file = self.task_dir / 'energy_format.dat'
-        eigen_data = self.nwchem.get_eigen_energy(td_out)
+        # Both arrays come from one read of the TD output, unless they are already cached.
+        td = None
+
+        def read_td():
+            nonlocal td
+            if td is None:
+                td = self.nwchem.parse_td(td_out)
+            return td
+
+        eigen_data = _cached_parse(td_out, 'eig', (), lambda: read_td().eigen)
         occ, unocc = get_occ_unocc(eigen_data)
         if (len(occ) < below_homo) or (len(unocc) < above_lumo):
             raise InputError(f'The selected MO is out of range. Number of MO: below HOMO = {len(occ)}, above_LUMO = {len(unocc)}')
         self.mo_population_file = self.task_dir / 'mo_population.dat'
         self.task_info.output['mopop_file'] = str(self.mo_population_file.relative_to(self.directory))
-        self.nwchem.get_td_moocc(str(self.mo_population_file), td_out, homo_index=len(occ),
-                                     below_homo=below_homo, above_lumo=above_lumo)
+        pop_data = _cached_parse(td_out, 'moocc', (), lambda: read_td().moocc)
+        extract_pop_window(pop_data, str(self.mo_population_file), len(occ), below_homo, above_lumo)
         self.mo_population_diff_file = self.task_dir/ 'mo_pop_diff.dat'
         self.task_info.output['mopop_diff_file'] = str(self.mo_population_diff_file.relative_to(self.directory))
         calc_population_diff(homo_index=self.below_homo, infile=self.mo_population_file,
@@ -325,8 +343,10 @@ class NwchemTask(BaseNwchemTask):
             plot_multiple_column(pop_data, column_list=column_range, column_dict=legend_dict, xlabel='Time (au)')
     
 
+_XC_SET = frozenset(nwchem_gs_param_data['xc']['values'])
+_BASIS_SET = frozenset(nwchem_gs_param_data['basis']['values'])
+
 def format_gs_param(gen_dict:dict) -> dict:
-    param_data = nwchem_gs_param_data
     restart = gen_dict.get('restart', False)
     
 
@@ -340,13 +360,13 @@ def format_gs_param(gen_dict:dict) -> dict:
         raise InputError(f'Unkown basis type: {basis_type}')
 
     xc = gen_dict.get('xc')
-    if xc not in param_data['xc']['values']:
-        raise InputError('Unkown xc: {xc}')
+    if xc not in _XC_SET:
+        raise InputError(f'Unkown xc: {xc}')
     gs_input['dft']['xc'] = copy.deepcopy(nwchem_xc_map.get(xc))
 
     basis = gen_dict.get('basis')
-    if basis not in param_data['basis']['values']:
-        raise InputError('Unkown basis: {xc}')
+    if basis not in _BASIS_SET:
+        raise InputError(f'Unkown basis: {basis}')
     gs_input['basis'] = basis
     
     energy_conv = gen_dict.get('energy_conv', 1e-5)
@@ -401,26 +421,29 @@ def update_td_param(param):
 
             laser_list.append(laser_dict)
     else:
-        param['rt_tddft']['field'] = {'name': 'kick_' + read_pol_dir(pol)[1],
+        pol_dir = read_pol_dir(pol)[1]
+        param['rt_tddft']['field'] = {'name': 'kick_' + pol_dir,
                                         'type': 'delta',
-                                        'polarization':read_pol_dir(pol)[1],
+                                        'polarization':pol_dir,
                                         'max': strength}
 def add_gaussian_laser(name, laser):
-    laser_dict = {'name': f'{name}_'  + read_pol_dir(laser['polarization'])[1],
+    pol_dir = read_pol_dir(laser['polarization'])[1]
+    laser_dict = {'name': f'{name}_'  + pol_dir,
                     'type': 'gaussian',
                     'frequency' : laser['frequency'],
                     'center': laser['time0'],
                     'width': laser['sigma'],
-                    'polarization':read_pol_dir(laser['polarization'])[1],
+                    'polarization':pol_dir,
                     'max':laser['strength']}
 
                     
     return laser_dict
 
 def add_delta_laser(name, laser):
-    laser_dict = {'name': f'{name}_' + read_pol_dir(laser['polarization'])[1],
+    pol_dir = read_pol_dir(laser['polarization'])[1]
+    laser_dict = {'name': f'{name}_' + pol_dir,
                 'type': 'delta',
-                'polarization':read_pol_dir(laser['polarization'])[1],
+                'polarization':pol_dir,
                 'max': laser['strength']}
     return laser_dict
 
@@ -432,13 +455,15 @@ def out_print(property):
             p.append('moocc')
         return p
 
-def read_pol_dir(pol):        
-        if pol == [1,0,0]:
-            return (0,'x')
-        elif pol == [0,1,0]:
-            return (1,'y') 
-        elif pol == [0,0,1]:
-            return (2,'z')
+_POL_MAP = {(1,0,0): (0,'x'),
+            (0,1,0): (1,'y'),
+            (0,0,1): (2,'z')}
+
+def read_pol_dir(pol):
+    try:
+        return _POL_MAP[tuple(pol)]
+    except (KeyError, TypeError) as e:
+        raise InputError(f'Unsupported polarization: {pol}') from e
 
 
 def get_pol_and_tag(taskinfo):
@@ -451,6 +476,95 @@ def get_pol_and_tag(taskinfo):
     return pol, tag
 
 
+def _cached_parse(out_file, kind, key, parse):
+    """Returns the array parsed from an engine output file, memoized on disk.
+
+    Arrays are kept under the user cache directory, outside the project, as
+    <kind>-<path digest>-<state digest>.npy. The state digest covers the file's
+    modification time, key and the litesoph version, so any change re-parses
+    and replaces the older entry for the same file."""
+    out_file = Path(out_file).resolve()
+    path_digest = hashlib.blake2b(str(out_file).encode(), digest_size=8).hexdigest()
+    state = repr((out_file.stat().st_mtime_ns, *key, __version__))
+    state_digest = hashlib.blake2b(state.encode(), digest_size=8).hexdigest()
+    cache_dir = user_cache_dir / 'parse'
+    cache_file = cache_dir / f'{kind}-{path_digest}-{state_digest}.npy'
+    try:
+        # Read fully rather than memory-mapped: callers get a writable array,
+        # and the cache file is not held open while it may be replaced.
+        return np.load(cache_file)
+    except (OSError, ValueError): pass
+    data = np.asarray(parse())
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        for stale in cache_dir.glob(f'{kind}-{path_digest}-*.npy'):
+            stale.unlink()
+        tmp_file = cache_file.with_suffix(f'.{os.getpid()}.tmp')
+        with open(tmp_file, 'wb') as f:
+            np.save(f, data)
+        os.replace(tmp_file, cache_file)
+    except OSError: pass
+    return data
+
+def _extract_dm(td_out_file, pol, tag):
+    from litesoph.engines.nwchem.nwchem_read_rt import nwchem_rt_parser
+
+    def parse():
+        return nwchem_rt_parser(td_out_file, outfile=None, tag=tag,
+                geometry='system', 
+                target='dipole', spin='closedshell', 
+                polarization=pol, zero=False, retrun_data=True)
+    return _cached_parse(td_out_file, 'dm', (pol, tag), parse)
+
+def _generate_delay_spectrum(td_out_file, pol, tag, dm_file, spectrum_file, damping, padding,
+                            dm_as_npy=False):
+    """Extracts the dipole moment of a single delay and computes its spectrum.
+
+    Kept at module level so that it can be run in a worker process."""
+    from litesoph.post_processing.spectrum import photoabsorption_spectrum
+    dm_data = np.asarray(_extract_dm(td_out_file, pol, tag))
+    if dm_as_npy:
+        np.save(dm_file, dm_data)
+    else:
+        np.savetxt(dm_file, dm_data, delimiter='\t', header="time \t dm")
+    photoabsorption_spectrum(dm_data, spectrum_file, process_zero=False, damping=damping, padding=padding)
+
+
+def _prefetch_files(files):
+    """Asks the kernel to start reading all the files ahead of use, so that they are
+    fetched concurrently instead of one at a time as each parser opens them.
+    Does nothing on platforms without posix_fadvise."""
+    if not hasattr(os, 'posix_fadvise'):
+        return
+    for file in files:
+        try:
+            fd = os.open(file, os.O_RDONLY)
+        except OSError:
+            continue
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+
+@lru_cache(maxsize=8)
+def _load_contour_cached(path: str, mtime_ns: int):
+    if path.endswith('.npy'):
+        # Not memory-mapped: generate_tas_data rewrites these files, which an
+        # open mapping would block on Windows.
+        return np.load(path)
+    return np.loadtxt(path)
+
+def _load_contour(path):
+    """Loads contour data, preferring the .npy sibling of the text file if present.
+    Loaded arrays are cached on (path, modification time)."""
+    path = Path(path)
+    npy_path = path.with_suffix('.npy')
+    if npy_path.exists():
+        path = npy_path
+    return _load_contour_cached(str(path), path.stat().st_mtime_ns)
+
 class PumpProbePostpro(NwchemTask):
 
     """
@@ -467,36 +581,50 @@ class PumpProbePostpro(NwchemTask):
 
         self.network_done_file = self.task_dir / 'Done'
         self.only_workflow_dirpath=self.project_dir.name
-        self.only_task_dirpath=Path(self.task_dir).relative_to(self.project_dir)
+        self.only_task_dirpath=self.task_dir.relative_to(self.project_dir)
     
     def extract_dm(self,td_out_file,pol,tag):
-        from litesoph.engines.nwchem.nwchem_read_rt import nwchem_rt_parser                
-        dm_data=nwchem_rt_parser(td_out_file, outfile=None, tag=tag,
-                    geometry='system', 
-                    target='dipole', spin='closedshell', 
-                    polarization=pol, zero=False, retrun_data=True)
-        return dm_data
+        return _extract_dm(td_out_file, pol, tag)
         
-    def generate_spectrums(self,damping=None,padding=None):
-        """generate spectrum file from dipole moment data"""
+    def generate_spectrums(self,damping=None,padding=None, dm_as_npy=False):
+        """generate spectrum file from dipole moment data
+
+        The dipole moment of each delay is stored as the tab separated
+        dm_delay_<delay>.dat, like the other engines, or as dm_delay_<delay>.npy
+        if dm_as_npy is True."""
         
-        for i in range(len(self.dependent_tasks)):            
-            self.pol, tag = get_pol_and_tag(self.dependent_tasks[i])
-            td_out_file = (self.project_dir / (self.dependent_tasks[i].output.get('txt_out'))) 
+        task_dir = Path(self.project_dir.parent/self.only_workflow_dirpath/self.only_task_dirpath)
+        spectrum_files = {}
+        jobs = []
+        for task_info in self.dependent_tasks:
+            self.pol, tag = get_pol_and_tag(task_info)
+            td_out_file = self.project_dir / task_info.output.get('txt_out')
+            delay = task_info.param.get('delay')
+
+            out_spectrum_file = Path(self.only_task_dirpath) /f'spec_delay_{delay}.dat'
+            spectrum_files[delay] = out_spectrum_file
+            dm_ext = '.npy' if dm_as_npy else '.dat'
+            out_standard_dm_file = task_dir /f'dm_delay_{delay}{dm_ext}'
+            spec_file_path = Path(self.project_dir.parent/self.only_workflow_dirpath)/out_spectrum_file
+            jobs.append((td_out_file, self.pol, tag, out_standard_dm_file, spec_file_path, damping, padding,
+                         dm_as_npy))
+
+        _prefetch_files(job[0] for job in jobs)
+
+        # Every delay is independent, so spread them over worker processes.
+        # They are spawned, not forked: this runs inside the GUI process, which
+        # has other threads running and holds Tk state a fork must not copy.
+        max_workers = min(len(jobs), os.cpu_count() or 1)
+        if max_workers > 1:
+            with ProcessPoolExecutor(max_workers=max_workers,
+                                     mp_context=multiprocessing.get_context('spawn')) as executor:
+                list(executor.map(_generate_delay_spectrum, *zip(*jobs)))
+        else:
+            for job in jobs:
+                _generate_delay_spectrum(*job)
 
-            gen_standard_dm_file=self.extract_dm(td_out_file,self.pol,tag)
-            delay=self.dependent_tasks[i].param.get('delay')             
-            
-            out_spectrum_file= Path(self.only_task_dirpath) /f'spec_delay_{delay}.dat'            
-            self.task_info.output[f'spec_delay_{delay}']=out_spectrum_file             
-            out_standard_dm_file= Path(self.project_dir.parent/self.only_workflow_dirpath/self.only_task_dirpath) /f'dm_delay_{delay}.dat'                        
-            np.savetxt(out_standard_dm_file, gen_standard_dm_file, delimiter='\t', header="time \t dm")
-            
-            from litesoph.post_processing.spectrum import photoabsorption_spectrum      
-            damping_var= None if damping is None else damping 
-            padding_var= None if padding is None else padding       
-            spec_file_path= Path(self.project_dir.parent/self.only_workflow_dirpath)/out_spectrum_file
-            photoabsorption_spectrum(out_standard_dm_file,spec_file_path, process_zero=False,damping=damping_var,padding=padding_var)
+        for delay, out_spectrum_file in spectrum_files.items():
+            self.task_info.output[f'spec_delay_{delay}'] = out_spectrum_file
 
     def generate_tas_data(self):
         from litesoph.visualization.plot_spectrum import get_spectrums_delays,prepare_tas_data                
@@ -514,42 +642,36 @@ class PumpProbePostpro(NwchemTask):
         contour_z_data_file=Path(self.project_dir.parent/self.only_workflow_dirpath)/self.contour_z_data_file
         
         delay_list,spectrum_data_list=get_spectrums_delays(self.task_info,self.dependent_tasks,self.project_dir,self.only_workflow_dirpath)
-        prepare_tas_data(spectrum_data_list,delay_list,contour_x_data_file,contour_y_data_file,contour_z_data_file)
+        prepare_tas_data(spectrum_data_list,delay_list,contour_x_data_file,contour_y_data_file,contour_z_data_file, save_npy=True)
                             
     def plot(self,delay_min=None,delay_max=None,freq_min=None,freq_max=None):     
         from litesoph.visualization.plot_spectrum import contour_plot
-        x_data = np.loadtxt(self.project_dir.parent / (self.task_info.output.get('contour_x_data')))
-        y_data = np.loadtxt(self.project_dir.parent / (self.task_info.output.get('contour_y_data')))
-        z_data = np.loadtxt(self.project_dir.parent / (self.task_info.output.get('contour_z_data')))
-                        
-        x_min= np.min(x_data) if delay_min is None else delay_min 
-        x_max= np.max(x_data) if delay_max is None else delay_max 
-        y_min= np.min(y_data) if freq_min is None else freq_min 
-        y_max= np.max(y_data) if freq_max is None else freq_max 
-
-        plot=contour_plot(x_data,y_data,z_data, 'Delay Time (femtosecond)','Frequency (eV)', 'Pump Probe Analysis',x_min,x_max,y_min,y_max)
-        return plot
-        
-    def plot(self,delay_min=None,delay_max=None,freq_min=None,freq_max=None):     
-        from litesoph.visualization.plot_spectrum import contour_plot
-        x_data = np.loadtxt(self.project_dir.parent /self.only_workflow_dirpath/ (self.task_info.output.get('contour_x_data')))
-        y_data = np.loadtxt(self.project_dir.parent /self.only_workflow_dirpath/ (self.task_info.output.get('contour_y_data')))
-        z_data = np.loadtxt(self.project_dir.parent /self.only_workflow_dirpath/ (self.task_info.output.get('contour_z_data')))
+        x_data = _load_contour(self.project_dir.parent /self.only_workflow_dirpath/ (self.task_info.output.get('contour_x_data')))
+        y_data = _load_contour(self.project_dir.parent /self.only_workflow_dirpath/ (self.task_info.output.get('contour_y_data')))
+        z_data = _load_contour(self.project_dir.parent /self.only_workflow_dirpath/ (self.task_info.output.get('contour_z_data')))
+
+        # The grids come from np.meshgrid(delays, frequencies), so the delays are the first
+        # row and the frequencies the first column. Reducing only those keeps the
+        # memory-mapped grids from being paged in just to find the limits.
+        delays = x_data[0] if x_data.ndim == 2 else x_data
+        freqs = y_data[:, 0] if y_data.ndim == 2 else y_data
+        delay_lo, delay_hi = delays.min(), delays.max()
+        freq_lo, freq_hi = freqs.min(), freqs.max()
                         
-        if delay_min is None: x_min= np.min(x_data)
-        elif delay_min < np.min(x_data): raise InputError(f'Minimum delay limit out of range. Allowed minimum delay limit is {np.min(x_data)}')
+        if delay_min is None: x_min= delay_lo
+        elif delay_min < delay_lo: raise InputError(f'Minimum delay limit out of range. Allowed minimum delay limit is {delay_lo}')
         else: x_min= delay_min
 
-        if delay_max is None: x_max= np.max(x_data)
-        elif delay_max > np.max(x_data): raise InputError(f'Maximum delay limit out of range. Allowed maximum delay limit is {np.max(x_data)}')
+        if delay_max is None: x_max= delay_hi
+        elif delay_max > delay_hi: raise InputError(f'Maximum delay limit out of range. Allowed maximum delay limit is {delay_hi}')
         else: x_max= delay_max
     
-        if freq_min is None: y_min= np.min(y_data)
-        elif freq_min < np.min(y_data): raise InputError(f'Minimum frequency limit out of range. Allowed minimum frequency limit is {np.min(y_data)}')
+        if freq_min is None: y_min= freq_lo
+        elif freq_min < freq_lo: raise InputError(f'Minimum frequency limit out of range. Allowed minimum frequency limit is {freq_lo}')
         else: y_min= freq_min
 
-        if freq_max is None:y_max= np.max(y_data)
-        elif freq_max > np.max(y_data):raise InputError(f'Maximum frequency limit out of range. Allowed maximum frequency is {np.max(y_data)}')
+        if freq_max is None:y_max= freq_hi
+        elif freq_max > freq_hi:raise InputError(f'Maximum frequency limit out of range. Allowed maximum frequency is {freq_hi}')
         else: y_max= freq_max
     
         plot=contour_plot(x_data,y_data,z_data, 'Delay Time (femtosecond)','Frequency (eV)', 'Pump Probe Analysis',x_min,x_max,y_min,y_max)
@@ -67,35 +67,33 @@ def compute_fft(ifname: str,
     return np.stack((w, fw_re, fw_im, fw_abs)).T
 
 def rotate_spectrum (data):
-    for v in data:
-        w = v[0]
-        re = v[1]
-        im = v[2]
-        ab = v[3]
-        
-        r = math.sqrt (re**2 + im**2)
-        if abs (r - ab) > 1e-5:
-            raise Exception ("abs not equal to sqrt(re^2 + im^2)")
+    w = data[:, 0]
+    re = data[:, 1]
+    im = data[:, 2]
+    ab = data[:, 3]
+
+    r = np.sqrt(re**2 + im**2)
+    if np.any(np.abs(r - ab) > 1e-5):
+        raise Exception ("abs not equal to sqrt(re^2 + im^2)")
 
-        angle = abs (math.atan2 (im, re))
+    angle = np.abs(np.arctan2(im, re))
 
-        if angle > math.pi:
-            raise Exception ("atan2 out of range")
+    if np.any(angle > math.pi):
+        raise Exception ("atan2 out of range")
 
-        re_out = ab * math.cos (angle)
-        im_out = ab * math.sin (angle)
+    re_out = ab * np.cos(angle)
+    im_out = ab * np.sin(angle)
 
-        yield [w, re_out, im_out, ab]
+    return np.column_stack((w, re_out, im_out, ab))
 
         
 def photoabsorption_spectrum(dipole_file, spectrum_file,  process_zero=False, damping=None,padding=None):
 
     data = compute_fft(dipole_file, process_zero, damping,padding)
     data_rot = rotate_spectrum (data)
-    with open(spectrum_file,"w+") as f:
-        f.write("#Energy(eV)\tosc\tnorm\n")
-        for d in data_rot:
-            f.write("%20.10e\t%20.10e\t%20.10e\n" %(d[0] * 27.2114, d[0] * d[2], d[3])) 
+    out = np.column_stack((data_rot[:, 0] * 27.2114, data_rot[:, 0] * data_rot[:, 2], data_rot[:, 3]))
+    np.savetxt(spectrum_file, out, fmt="%20.10e", delimiter="\t",
+                header="#Energy(eV)\tosc\tnorm", comments="")
 
 def main():
     parser = argparse.ArgumentParser()
@@ -4,6 +4,10 @@ import subprocess
 from litesoph.post_processing.octopus.oct_projections import Projections
 from litesoph.engines.octopus.octopus_input import generate_input
 
+# Projection data is written a few characters per call, so use a large
+# buffer to cut down the number of write syscalls.
+WRITE_BUFFER_SIZE = 1 << 17
+
 class Octopus:
     def __init__(self,infile=None, outfile=None, 
                 directory=".", cmd=None, **kwargs) -> None:
@@ -36,7 +40,7 @@ class Octopus:
         if self.directory != Path.cwd() and not Path(self.directory).is_dir():
             os.makedirs(self.directory)
 
-        with open(self.infile_path, 'w+') as f:
+        with open(self.infile_path, 'w') as f:
             f.write(self.template)   
 
     def run(self):
@@ -177,7 +181,7 @@ class Octopus:
         popln = proj.populations(proj.states_projected)
 
         ### Writing to file
-        with open(out_file,"w") as fp:
+        with open(out_file,"w", buffering=WRITE_BUFFER_SIZE) as fp:
             proj.write_pop(popln,fp)
 
         return [proj,popln]
@@ -212,7 +216,7 @@ class Octopus:
         transwt_path = out_directory / Path("transwt.dat")
         spectrum_prop_path = out_directory / Path("spectrum_prop.dat")
        
-        fp=open(dmat_path,"w")	
+        fp=open(dmat_path,"w", buffering=WRITE_BUFFER_SIZE)	
         proj.write_dmat(t,dmat,enocc,enuocc,fp)
         fp.close()
        
@@ -221,20 +225,20 @@ class Octopus:
        
         # nus = 2.0*np.pi*nus     ## Convert to omega       
 	   
-        fp=open(dmatw_path,"w")
+        fp=open(dmatw_path,"w", buffering=WRITE_BUFFER_SIZE)
         proj.write_dmat(nus,dmatw,enocc,enuocc,fp)
         fp.close()
 
-        fp=open(strength_path,"w")
+        fp=open(strength_path,"w", buffering=WRITE_BUFFER_SIZE)
         proj.write_dmatr(nus,strengthKS,enocc,enuocc,fp)
         fp.close()
        
-        fp=open(transwt_path,"w")
+        fp=open(transwt_path,"w", buffering=WRITE_BUFFER_SIZE)
         proj.write_dmatr(nus,transwt,enocc,enuocc,fp)
         fp.close()
        
 #######  Plot the particle-hole resolved strength function 
-        fp=open(spectrum_prop_path,"w")
+        fp=open(spectrum_prop_path,"w", buffering=WRITE_BUFFER_SIZE)
         nuspos = np.where(nus >=0)[0]
         for iw in range(nuspos.size):
              fp.write("%10.6f %10.6f \n" %(nuspos[iw],strength[iw]))
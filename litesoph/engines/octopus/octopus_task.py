@@ -159,16 +159,17 @@ class OctopusTask(Task):
 
         for dir in [self.engine_dir, self.output_dir]:
             self.create_directory(Path(dir))
-        log_files = list(Path(self.output_dir).iterdir())
+        with os.scandir(self.output_dir) as entries:
+            log_files = [entry.path for entry in entries]
         for log in log_files:
-            os.remove(Path(self.output_dir)/log) 
+            os.remove(log)
 
         # Restart dir
         restart_dir = self.task_data.get('restart')
         if self.restart:
             if restart_dir is not None:
                 restart_path = Path(self.engine_dir) / str(restart_dir)
-                if not Path.is_dir(restart_path):
+                if not restart_path.is_dir():
                     raise InputError(f'Can not restart! Restart folder: {str(restart_path)} not found.')
             else:
                 raise InputError(f'No restart folder assigned!')
@@ -296,8 +297,8 @@ class OctopusTask(Task):
         r_fname = r_prefix + str(1)
         fpath = Path(folder)/r_fname
         
-        if Path.exists(Path(fpath)):
-            _name = Path(fpath).name
+        if fpath.exists():
+            _name = fpath.name
             suff_int = int(re.match('.*?([0-9]+)$', _name).group(1))+1
             new_r_fname = r_prefix + str(suff_int)
             new_r_fpath = Path(folder)/new_r_fname
@@ -328,9 +329,9 @@ class OctopusTask(Task):
         """Handles copying output folders to task directory from octopus specific folder structure
         for local run"""
         
-        log_files = list(Path(self.output_dir).iterdir())
-        for log in log_files:
-            shutil.copy(Path(self.output_dir)/log, Path(self.task_dir))
+        with os.scandir(self.output_dir) as entries:
+            for log in entries:
+                shutil.copy(log.path, self.task_dir)
         task = self.task_name
         if task == tt.GROUND_STATE:
             folders = ['exec', 'static']
@@ -1,5 +1,9 @@
 #from litesoph.common.task import (GROUND_STATE, RT_TDDFT_DELTA, RT_TDDFT_LASER,SPECTRUM, TCM, MO_POPULATION, MASKING)
 
+import sys
+
+from litesoph.common.task_data import TaskTypes
+
 # SHOW_PAGE_EVENT = '<<Show{}Page>>'
 # SHOW_WORK_MANAGER_PAGE = SHOW_PAGE_EVENT.format('WorkManager')
 # SHOW_GROUND_STATE_PAGE = SHOW_PAGE_EVENT.format(GROUND_STATE)
@@ -20,4 +24,27 @@ OPEN_PROJECT = '<<OpenExistingProject>>'
 ON_PROCEED = '<<SelectProceed>>' 
 ON_BACK_BUTTON = '<<ClickBackButton>>'
 REFRESH_CONFIG = '<<RefreshConfig>>'
-OPEN_LS_VIZ= '<<LSViz>>'
\ No newline at end of file
+OPEN_LS_VIZ= '<<LSViz>>'
+
+
+class _TaskEvents(dict):
+    """Maps a task name to its per-task virtual event name.
+
+    Names are interned and built once per task, from the plain task name
+    value, so TaskTypes members and their string values give the same event."""
+
+    def __init__(self, pattern):
+        super().__init__()
+        self.pattern = pattern
+        for task in TaskTypes:
+            self[task]
+
+    def __missing__(self, task_name):
+        event = sys.intern(self.pattern.format(getattr(task_name, 'value', task_name)))
+        self[task_name] = event
+        return event
+
+GENERATE_SCRIPT = _TaskEvents('<<Generate{}Script>>')
+SAVE_SCRIPT = _TaskEvents('<<Save{}Script>>')
+SUB_LOCAL = _TaskEvents('<<SubLocal{}>>')
+SUB_NETWORK = _TaskEvents('<<SubNetwork{}>>')
@@ -15,6 +15,7 @@ class LaserDesignController:
         # Data extracted from TD page
         self.td_data = td_param  # GUI inputs extracted
         self.laser_info = m.LaserInfo(laser_data)
+        self.app = app
         self.main_window = app.main_window
         self.view = view
         self.focus = None
@@ -29,11 +30,11 @@ class LaserDesignController:
     def bind_events_and_update_default_view(self):
         # TODO: update these event bindings
 
-        self.main_window.bind_all('<<AddLaser>>', self._on_add_laser)
-        self.main_window.bind_all('<<EditLaser>>', self._on_edit_laser)
-        self.main_window.bind_all('<<RemoveLaser>>', self._on_remove_laser)
-        self.main_window.bind_all('<<PlotLaser>>', self._on_plotting)
-        self.main_window.bind_all('<<SelectLaser&UpdateView>>', self._on_select_laser)
+        self.app.bind_event('<<AddLaser>>', self._on_add_laser, widget=self.view)
+        self.app.bind_event('<<EditLaser>>', self._on_edit_laser, widget=self.view)
+        self.app.bind_event('<<RemoveLaser>>', self._on_remove_laser, widget=self.view)
+        self.app.bind_event('<<PlotLaser>>', self._on_plotting, widget=self.view)
+        self.app.bind_event('<<SelectLaser&UpdateView>>', self._on_select_laser, widget=self.view)
 
         # Collecting exp_type from td_data passed from TDPage
         # TODO: decide on to retain previous exp_type sets
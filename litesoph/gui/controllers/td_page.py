@@ -12,6 +12,7 @@ from litesoph.gui.models import inputs as inp
 from litesoph.gui.utils import dict2string
 from litesoph.gui.task_controller import TaskController
 from litesoph.gui import design
+from litesoph.gui import actions
 from litesoph.gui.controllers.laser_page import (LaserDesignController, 
                                                 extract_lasers_from_pulses,
                                                 add_delay_to_lasers)
@@ -49,10 +50,10 @@ class TDPageController(TaskController):
         self.task_view = self.app.show_frame(task_view, self.task_name)
         self.job_sub_page.back2task.config(command= self.show_task_view)
 
-        self.main_window.bind_all('<<BackonTDPage>>', self._on_back)
-        self.main_window.bind_all(f'<<Generate{self.task_name}Script>>', self.generate_input)
-        self.main_window.bind_all('<<Design&EditLaser>>', self._on_design_edit_laser)    
-        self.main_window.bind_all('<<ViewLaserSummary>>', self._on_view_lasers)    
+        self.app.bind_event('<<BackonTDPage>>', self._on_back, widget=self.task_view)
+        self.app.bind_event(actions.GENERATE_SCRIPT[self.task_name], self.generate_input, widget=self.task_view)
+        self.app.bind_event('<<Design&EditLaser>>', self._on_design_edit_laser, widget=self.task_view)    
+        self.app.bind_event('<<ViewLaserSummary>>', self._on_view_lasers, widget=self.task_view)    
         self.task_view.set_sub_button_state('disable')
 
         if hasattr(self.task_view, 'set_parameters'):
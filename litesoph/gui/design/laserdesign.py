@@ -239,11 +239,7 @@ class LaserDesignPage(View):
         self.parent = parent
         myFont = font.Font(family='Helvetica', size=10, weight='bold')
         
-        copy_laser_design_input = copy.deepcopy(laser_design_input)        
-        self.inp = InputFrame(self.input_param_frame,fields=copy_laser_design_input, padx=5, pady=5)       
-        self.inp.grid(row=0, column=0)
-
-        set_state(self.inp.group["Masking Inputs"],'disabled')
+        self._build_inputs()
 
         self.tree = self.create_laser_tree_view(parent=self.input_param_frame)      
         self.tree.bind('<<TreeviewSelect>>', self.OnSingleClick)
@@ -264,8 +260,21 @@ class LaserDesignPage(View):
         self.button_reset['font'] = myFont
         self.button_reset.grid(row=0, column=8, padx=3, pady=3,sticky='nsew')
 
+    def _build_inputs(self):
+        copy_laser_design_input = copy.deepcopy(laser_design_input)        
+        self.inp = InputFrame(self.input_param_frame,fields=copy_laser_design_input, padx=5, pady=5)       
+        self.inp.grid(row=0, column=0)
+
+        set_state(self.inp.group["Masking Inputs"],'disabled')
         self.trace_variables()
 
+    def reset_view(self):
+        """Rebuilds the laser inputs, so widget states and field visibility set
+        for the previous task (e.g. a disabled pump-probe tag) do not carry over."""
+        self.inp.destroy()
+        self._build_inputs()
+        self.tree.delete(*self.tree.get_children())
+
     def trace_variables(self,*_):
         for name, var in self.inp.variable.items():
             if name in ["masking"]:
@@ -80,7 +80,7 @@ class MaskingPage(View):
         self.label_title_energy_coupling['font'] = myfont()
         self.label_title_energy_coupling.grid(row=1, column=0, padx=5, pady=10)
 
-        self.energy_coupling_button = tk.Button(self.Frame_energy_coupling, text="Compute", activebackground="#78d6ff", command= lambda : self.event_generate(f'<<SubLocal{self.task_name}>>'))
+        self.energy_coupling_button = tk.Button(self.Frame_energy_coupling, text="Compute", activebackground="#78d6ff", command= lambda : self.event_generate(actions.SUB_LOCAL[self.task_name]))
         self.energy_coupling_button['font'] = myfont()
         self.energy_coupling_button.grid(row=1, column=1)
 
@@ -3,6 +3,7 @@ import tkinter as tk
 from tkinter import font
 from tkinter.ttk import Spinbox, Checkbutton, Combobox, Button
 
+from litesoph.gui import actions
 from litesoph.gui.design.template import View, InputFrame, add_job_frame
 from litesoph.gui.design.tools import hide_message, show_message
 from litesoph.gui.defaults_handler import update_td_laser_defaults
@@ -205,10 +206,10 @@ class TDPage(View):
         self.event_generate('<<BackonTDPage>>')
 
     def generate_input_button(self):
-        self.event_generate(f'<<Generate{self.task_name}Script>>')
+        self.event_generate(actions.GENERATE_SCRIPT[self.task_name])
 
     def save_button(self):
-        self.event_generate('<<Save'+self.task_name+'Script>>')
+        self.event_generate(actions.SAVE_SCRIPT[self.task_name])
 
     def show_laser_summary(self):
         self.event_generate('<<ViewLaserSummary>>')
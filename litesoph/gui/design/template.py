@@ -6,6 +6,7 @@ from tkinter import TclError
 from litesoph.gui.input_validation import Onlydigits
 from litesoph.gui.visual_parameter import myfont, config_widget
 from litesoph.gui import visual_parameter as v
+from litesoph.gui import actions
 
 def add_job_frame(obj, parent, task_name, row:int=0, column:int=0):  
     """  Adds submit job buttons """
@@ -13,11 +14,11 @@ def add_job_frame(obj, parent, task_name, row:int=0, column:int=0):
     submit_frame = ttk.Frame(parent,borderwidth=2, relief='groove')
     submit_frame.grid(row=row, column=column, sticky='nswe')
 
-    obj.sublocal_Button = tk.Button(submit_frame, text="Submit Local", activebackground="#78d6ff", command=lambda: obj.event_generate('<<SubLocal'+task_name+'>>'))
+    obj.sublocal_Button = tk.Button(submit_frame, text="Submit Local", activebackground="#78d6ff", command=lambda: obj.event_generate(actions.SUB_LOCAL[task_name]))
     obj.sublocal_Button['font'] = myfont()
     obj.sublocal_Button.grid(row=1, column=2,padx=3, pady=6, sticky='nsew')
     
-    obj.subnet_Button = tk.Button(submit_frame, text="Submit Network", activebackground="#78d6ff", command=lambda: obj.event_generate('<<SubNetwork'+task_name+'>>'))
+    obj.subnet_Button = tk.Button(submit_frame, text="Submit Network", activebackground="#78d6ff", command=lambda: obj.event_generate(actions.SUB_NETWORK[task_name]))
     obj.subnet_Button['font'] = myfont()
     obj.subnet_Button.grid(row=2, column=2, padx=3, pady=6, sticky='nsew')
 
@@ -90,6 +91,11 @@ class View(ttk.Frame):
         self.sublocal_Button.config(state=state)
         self.subnet_Button.config(state=state)
 
+    def reset_view(self):
+        """Called by GUIAPP.show_frame before a cached page is shown again.
+        Pages that keep per-task widget state restore it here."""
+        pass
+
 
 class InputFrame(ttk.Frame):
     """ 
@@ -2,11 +2,18 @@ from tkinter import ttk
 from tkinter import filedialog
 from tkinter import messagebox
 
-from typing import OrderedDict
 import tkinter as tk
 import pygubu
 
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+import functools
+import heapq
+import itertools
 import pathlib 
+import queue
+import threading
+import time
 
 
 #---LITESOPH modules
@@ -40,30 +47,31 @@ class GUIAPP:
 
         self.builder.add_from_file(str(DESINGER_DIR / "main_window.ui"))
 
-        self.main_window = self.builder.get_object('mainwindow')
+        # Memoized builder lookups, shared with the panel managers.
+        self.get_object = functools.lru_cache(maxsize=None)(self.builder.get_object)
+        self.get_variable = functools.lru_cache(maxsize=None)(self.builder.get_variable)
+
+        self.main_window = self.get_object('mainwindow')
 
         menu_class = get_main_menu_for_os('Linux')
         menu = menu_class(self.main_window)
         self.main_window.config(menu=menu)
 
-        self.treeview = self.builder.get_object('treeview1')
+        self.treeview = self.get_object('treeview1')
 
-        self.input_frame = self.builder.get_object('inputframe')
+        self.input_frame = self.get_object('inputframe')
 
         create_design_feature()
 
         self.project_window = None
 
-        # self.navigation = ProjectList(self)
-        self.project_tree_view = ProjectTreeNavigation(self)
-        self.view_panel = ViewPanelManager(self)
         self.ls_manager = LSManager()
         self.curent_project_manager = None
         self.engine = None
 
         self.setup_bottom_panel()
 
-        self.status_engine = self.builder.get_variable('cengine_var')
+        self.status_engine = self.get_variable('cengine_var')
         self.status_engine.set('')
         
         self.builder.connect_callbacks(self)
@@ -71,15 +79,66 @@ class GUIAPP:
         
         self.laser_design = None
 
-        self._frames = OrderedDict()
+        self._frames = {}
+        self._active_frame = None
+        # Virtual event sequence -> current callback, see bind_event.
+        self._event_handlers = {}
+        # Widget path name -> its own sequence table, dropped on <Destroy>.
+        self._widget_handlers = {}
+
+        # Periodic jobs share one Tk timer: a heap of (due time, seq, callback).
+        self._scheduled = []
+        self._schedule_seq = itertools.count()
+        self._tick_id = None
+
+        # Autosave writes the project data on this thread instead of the Tk one.
+        self._io_pool = ThreadPoolExecutor(max_workers=1)
+        self._save_future = None
+
+        # Network jobs report (callback, status, payload) here from their
+        # worker threads, see run_net_job.
+        self._net_result_q = queue.Queue()
+        self._net_pending = 0
         
+        # Whatever the start page does not need is set up from idle callbacks
+        # once the window is drawn, see _drain_init.
+        self._pending_init = deque([
+            self._setup_side_panels,
+            self._setup_controllers,
+            self._start_periodic_jobs,
+        ])
+        self.show_start_page()
+
+    def _setup_side_panels(self):
+        # self.navigation = ProjectList(self)
+        self.project_tree_view = ProjectTreeNavigation(self)
+        self.view_panel = ViewPanelManager(self)
+
+    def _setup_controllers(self):
         self.project_controller = ProjectController(self)
 
         #self._show_page_events()
         self._bind_event_callbacks()
-        self.show_start_page()
-        self.main_window.after(5000, self.save_data_repeat)
-        self.main_window.after(1000, self.update_project_tree)
+
+    def _start_periodic_jobs(self):
+        # The first autosave waits for Tk to be idle rather than a fixed delay,
+        # so it cannot land in the middle of handling the user's first click.
+        self.main_window.after_idle(self._arm_autosave)
+        self._schedule(1000, self.update_project_tree)
+
+    def _arm_autosave(self):
+        self.save_data_repeat()
+
+    def _drain_init(self):
+        """Runs one deferred setup step, then yields to Tk before the next one."""
+        if self._pending_init:
+            self._pending_init.popleft()()
+            self.main_window.after_idle(self._drain_init)
+
+    def _finish_init(self):
+        """Runs the remaining deferred setup steps right away."""
+        while self._pending_init:
+            self._pending_init.popleft()()
 
     def run(self):
         self.main_window.protocol("WM_DELETE_WINDOW", self.__on_window_close)
@@ -87,6 +146,8 @@ class GUIAPP:
 
     def __on_window_close(self):
         """Manage WM_DELETE_WINDOW protocol."""
+        # Let a pending autosave finish first so it cannot overwrite the final save.
+        self._io_pool.shutdown(wait=True)
         self.save_data()
         self.main_window.withdraw()
         self.main_window.destroy()
@@ -99,9 +160,79 @@ class GUIAPP:
 
         self.log_panel = LogPanelManager(self)
 
+    def _schedule(self, delay, callback):
+        """Runs callback once after delay milliseconds on the shared timer."""
+        entry = (time.monotonic() + delay / 1000, next(self._schedule_seq), callback)
+        heapq.heappush(self._scheduled, entry)
+        if self._scheduled[0] is entry:
+            self._arm_tick()
+
+    def _arm_tick(self):
+        if self._tick_id is not None:
+            self.main_window.after_cancel(self._tick_id)
+        delay = int((self._scheduled[0][0] - time.monotonic()) * 1000)
+        self._tick_id = self.main_window.after(max(10, delay), self._tick)
+
+    def _tick(self):
+        self._tick_id = None
+        now = time.monotonic()
+        try:
+            while self._scheduled and self._scheduled[0][0] <= now:
+                _, _, callback = heapq.heappop(self._scheduled)
+                callback()
+        finally:
+            if self._scheduled:
+                self._arm_tick()
+
+    def run_net_job(self, job, callback, start=None):
+        """Runs job off the Tk thread and then calls callback(status, payload) on it,
+        with ('ok', return value) or ('err', raised exception).
+        start(target) launches the worker thread, a plain daemon thread by default."""
+        def worker():
+            try:
+                result = ('ok', job())
+            except Exception as e:
+                result = ('err', e)
+            self._net_result_q.put((callback, *result))
+
+        if start is None:
+            start = lambda target: threading.Thread(target=target, daemon=True).start()
+        start(worker)
+        self._net_pending += 1
+        if self._net_pending == 1:
+            self._schedule(100, self._drain_net_results)
+
+    def _drain_net_results(self):
+        try:
+            while True:
+                try:
+                    callback, status, payload = self._net_result_q.get_nowait()
+                except queue.Empty:
+                    break
+                self._net_pending -= 1
+                callback(status, payload)
+        finally:
+            if self._net_pending:
+                self._schedule(100, self._drain_net_results)
+
     def save_data_repeat(self):
-        self.save_data()
-        self.main_window.after(30000, self.save_data_repeat)
+        self._schedule(30000, self.save_data_repeat)
+        self._save_data_in_background()
+
+    def _save_data_in_background(self):
+        """Snapshots the project data on the Tk thread and writes it on the io thread.
+        Skipped while the previous write is still running."""
+        future = self._save_future
+        if future is not None:
+            if not future.done():
+                return
+            self._save_future = None
+            # Surfaces an error raised by the previous write.
+            future.result()
+
+        snapshot = self.ls_manager.snapshot()
+        if snapshot:
+            self._save_future = self._io_pool.submit(self.ls_manager.save_snapshot, snapshot)
 
     def save_data(self):
         self.ls_manager.save()
@@ -109,7 +240,7 @@ class GUIAPP:
     def update_project_tree(self):
         if self.curent_project_manager:
             self.project_tree_view.update(self.curent_project_manager.project_info)
-        self.main_window.after(1000, self.update_project_tree)
+        self._schedule(1000, self.update_project_tree)
         
     def on_bpanel_button_clicked(self):
         self.log_panel.on_bpanel_button_clicked()
@@ -134,6 +265,8 @@ class GUIAPP:
 
         for widget in self.input_frame.winfo_children():
             widget.destroy()
+        self._frames.clear()
+        self._active_frame = None
 
         self.task_input_frame = ttk.Frame(self.input_frame)
         self.task_input_frame.pack(fill=tk.BOTH, side=tk.LEFT)
@@ -154,14 +287,30 @@ class GUIAPP:
         start_page.button_open_project.config(command= self._on_open_project)
         start_page.button_about_litesoph.config(command= about_litesoph)
         start_page.grid(row=0, column=0, sticky='NSEW')
+        self.main_window.after_idle(self._drain_init)
 
     def show_frame(self, frame,*args, **kwargs):
-        
-        # for widget in self.task_input_frame.winfo_children():
-        #     widget.destroy()
-        int_frame = frame(self.task_input_frame, *args, **kwargs)
-        int_frame.grid(row=0, column=0, sticky ='NSEW')
+        """Raises the frame(*args, **kwargs) page. The page is built on first use
+        and reused afterwards, until the workflow frames are recreated. A reused
+        page gets its reset_view() hook called before it is raised.
+        Pages built with unhashable arguments are not cached."""
+        key = (frame, args, tuple(sorted(kwargs.items())))
+        try:
+            int_frame = self._frames.get(key)
+        except TypeError:
+            key = int_frame = None
+
+        if int_frame is not None and int_frame.winfo_exists():
+            reset_view = getattr(int_frame, 'reset_view', None)
+            if reset_view is not None:
+                reset_view()
+        else:
+            int_frame = frame(self.task_input_frame, *args, **kwargs)
+            int_frame.grid(row=0, column=0, sticky ='NSEW')
+            if key is not None:
+                self._frames[key] = int_frame
         int_frame.tkraise()
+        self._active_frame = int_frame
 
         return int_frame
 
@@ -180,13 +329,39 @@ class GUIAPP:
         for event, callback in event_callbacks.items():
             self.main_window.bind_all(event, callback)                
     
-    def _show_workmanager_page(self, *_):
+    def bind_event(self, sequence, callback, widget=None):
+        """Routes the virtual event sequence to callback.
+
+        With widget, only events generated on that widget are routed, using a
+        binding on the widget itself. Its dispatch table is kept by the app and
+        dropped when the widget is destroyed. Otherwise the binding is
+        application wide (bind_all).
+
+        The Tk binding is created only the first time a sequence is bound. Later
+        calls just replace the callback in the dispatch table, instead of
+        registering a new Tcl command with every bind."""
+        if widget is None:
+            handlers = self._event_handlers
+            bind = self.main_window.bind_all
+        else:
+            key = str(widget)
+            handlers = self._widget_handlers.get(key)
+            if handlers is None:
+                handlers = self._widget_handlers[key] = {}
+                widget.bind('<Destroy>', functools.partial(self._forget_widget, key), add='+')
+            bind = widget.bind
+        if sequence not in handlers:
+            bind(sequence, functools.partial(self._dispatch_event, handlers, sequence))
+        handlers[sequence] = callback
 
-        self.show_frame(v.WorkManagerPage)
-        if self.engine:
-            self._frames[v.WorkManagerPage].engine.set(self.engine)
+    @staticmethod
+    def _dispatch_event(handlers, sequence, event):
+        return handlers[sequence](event)
 
-        self.show_project_summary()
+    def _forget_widget(self, key, event):
+        # A toplevel also sees <Destroy> of each of its children.
+        if str(event.widget) == key:
+            self._widget_handlers.pop(key, None)
 
     def _init_project(self, path):
         
@@ -197,6 +372,7 @@ class GUIAPP:
 
     def _on_open_project(self, *_):
         """creates dialog to get project path and opens existing project"""
+        self._finish_init()
         project_path = filedialog.askdirectory(title= "Select the existing Litesoph Project")
         if not project_path:
             return
@@ -210,6 +386,7 @@ class GUIAPP:
         self.show_project(self.curent_project_manager)
         
     def create_project_window(self, *_):
+        self._finish_init()
         self.project_window = v.CreateProjectPage(self.main_window)
         self.project_window.button_project.config(command= self._on_create_project)   
         
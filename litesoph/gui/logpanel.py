@@ -1,14 +1,13 @@
 class LogPanelManager:
     def __init__(self, app):
         self.app = app
-        builder = self.app.builder
-        self.btn_messages = builder.get_object('btn_messages')
-        self.txt_log = builder.get_object('text_log')
-        self.buttonsvar = builder.get_variable('bpanel_buttonsvar')
-        self.bpanel = builder.get_object('bpanel')
-        self.gcontainer = builder.get_object('bp_container')
-        self.gbuttons = builder.get_object('bp_buttons')
-        self.mainpw = builder.get_object('mainpw')
+        self.btn_messages = app.get_object('btn_messages')
+        self.txt_log = app.get_object('text_log')
+        self.buttonsvar = app.get_variable('bpanel_buttonsvar')
+        self.bpanel = app.get_object('bpanel')
+        self.gcontainer = app.get_object('bp_container')
+        self.gbuttons = app.get_object('bp_buttons')
+        self.mainpw = app.get_object('mainpw')
         self.mainpw.bind('<Configure>', self.pwindow_configure)
         self.mainpw_sash_pos = None
         self.gcontainer.pack_forget()
@@ -1,7 +1,6 @@
 from pathlib import Path
 import tkinter as tk
 import tkinter.ttk as ttk
-import collections
 import random
 from litesoph.common.data_sturcture.data_classes import ProjectInfo
 
@@ -11,35 +10,68 @@ class ProjectTreeNavigation:
     def __init__(self, app):
         
         self.app = app
-        self.treedata = dict()
-        self.current_path_list = []
         self.project_id_logger_dict=dict()
+        # iid -> (project uuid, text) of every node put in the treeview.
+        self._shown_nodes = dict()
+        self._update_id = None
         self.treeview = app.treeview
         self.treeview.heading('#0', text='Project and Workflows', anchor=tk.W)        
-        # self.treeview.bind('<<TreeviewOpen>>', self.open_node)
         self.treeview.bind("<Double-1>", self.OnDoubleClick)
         
     def update(self, project_info: ProjectInfo):
+        """Shows project_info in the tree once Tk is idle; calls made before
+        then are coalesced into one refresh of the latest project."""
         self.project_info = project_info
+        if self._update_id is None:
+            self._update_id = self.treeview.after_idle(self._run_update)
+
+    def _run_update(self):
+        self._update_id = None
         self._update_treeview()
     
     def _update_treeview(self):
-        project_name = self.project_info.label
-        
-        if not self.node_exists(self.project_info.uuid):
-            self.treeview.insert('', 'end', iid= self.project_info.uuid,
-                                        text = project_name, tags = 'project')
+        # Runs every second, so only the difference from what is shown reaches Tk.
+        project_id = self.project_info.uuid
+        current = set()
+        for parent, iid, text, tags in self._iter_nodes():
+            current.add(iid)
+            shown = self._shown_nodes.get(iid)
+            if shown is None:
+                self._insert_node(parent, iid, text, tags)
+            elif shown[1] != text:
+                self.treeview.item(iid, text= text)
+            else:
+                continue
+            self._shown_nodes[iid] = (project_id, text)
+
+        # Every current node is recorded by now, so equal sizes mean nothing was
+        # removed and the scan below can be skipped.
+        if len(self._shown_nodes) == len(current):
+            return
+        removed = [iid for iid, (pid, _) in self._shown_nodes.items()
+                        if pid == project_id and iid not in current]
+        for iid in removed:
+            del self._shown_nodes[iid]
+            # Deleting a workflow node already took its task nodes with it.
+            if self.node_exists(iid):
+                self.treeview.delete(iid)
+
+    def _insert_node(self, parent, iid, text, tags):
+        # One Tcl call per new node: inserting an iid Tk already has just fails.
+        try:
+            self.treeview.insert(parent, 'end', iid= iid, text= text, tags= tags)
+        except tk.TclError:
+            if not self.node_exists(iid):
+                raise
 
+    def _iter_nodes(self):
+        """Yields (parent, iid, text, tags) for the project, its workflows and tasks."""
+        project_id = self.project_info.uuid
+        yield '', project_id, self.project_info.label, 'project'
         for worfklow in self.project_info.workflows:
-            
-            if not self.node_exists(worfklow.uuid):
-                self.treeview.insert(self.project_info.uuid, 'end', iid= worfklow.uuid,
-                                        text= worfklow.label, tags = 'workflow')
+            yield project_id, worfklow.uuid, worfklow.label, 'workflow'
             for task in worfklow.tasks.values():
-                if self.node_exists(task.uuid):
-                    continue
-                self.treeview.insert(worfklow.uuid, 'end', iid= task.uuid,
-                                        text= task.name, tags= 'task')
+                yield worfklow.uuid, task.uuid, task.name, 'task'
 
     def node_exists(self, node_id):
         try:
@@ -50,7 +82,11 @@ class ProjectTreeNavigation:
             return True
         
     def OnDoubleClick(self, event):
-        item_id = self.treeview.selection()[0]
-        item = self.treeview.item(item_id)
-        if item['tags'][0] == 'workflow':
+        selection = self.treeview.selection()
+        if not selection:
+            return
+        item_id = selection[0]
+        # Only the tags are needed, not the whole item record.
+        tags = self.treeview.item(item_id, 'tags')
+        if tags and tags[0] == 'workflow':
             self.app.project_controller.open_workflow(item_id)
\ No newline at end of file
@@ -42,7 +42,7 @@ class ProjectController:
             actions.OPEN_LS_VIZ : self._open_ls_viz
         }
         for event, callback in event_callbacks.items():
-            self.main_window.bind_all(event, callback)          
+            self.app.bind_event(event, callback)          
 
     def open_workflow(self, workflow_uuid: str = ''):
         self.app.create_workflow_frames()
@@ -70,7 +70,11 @@ class ProjectController:
         if hasattr(self.workmanager_page, 'entry_workflow'):
             self.workmanager_page.entry_workflow['values'] = get_predefined_workflow()
         
-        self.workmanager_page._var['workflow'].trace_add('write', self.create_workflow_ui)
+        workflow_var = self.workmanager_page._var['workflow']
+        # A reused page still carries the trace added when it was last shown.
+        for mode, callback in workflow_var.trace_info():
+            workflow_var.trace_remove(mode, callback)
+        workflow_var.trace_add('write', self.create_workflow_ui)
         self.app.proceed_button.config(command= self.start_workflow)
         if self.engine:
             self.workmanager_page.engine.set(self.engine)
@@ -1,5 +1,6 @@
 import tkinter as tk
 import platform
+import threading
 from tkinter import messagebox
 from litesoph.gui.user_data import get_remote_profile, update_proj_list, update_remote_profile_list
 import copy
@@ -8,6 +9,7 @@ from litesoph.common.data_sturcture.data_classes import TaskInfo
 from litesoph.common.task import Task, TaskFailed, InputError
 from litesoph.common.task_data import TaskTypes as tt                                  
 from litesoph.gui import views as v
+from litesoph.gui import actions
 from litesoph.common import models as m
 from litesoph.gui.models.gs_model import choose_engine
 from litesoph.common.decision_tree import EngineDecisionError
@@ -15,6 +17,10 @@ from litesoph.gui.utils import dict2string
 from litesoph.gui.models import inputs as inp
 
 
+class _ConnectFailed(Exception):
+    """connect_to_network failed on the network submit thread."""
+
+
 class TaskController:
 
     def __init__(self, workflow_controller, app) -> None:
@@ -41,7 +47,7 @@ class TaskController:
         self.task_view = self.app.show_frame(task_view, self.task_info.engine, self.task_info.name)
         self.job_sub_page.back2task.config(command= self.show_task_view)
 
-        self.main_window.bind_all(f'<<Generate{self.task_name}Script>>', self.generate_input)
+        self.app.bind_event(actions.GENERATE_SCRIPT[self.task_name], self.generate_input, widget=self.task_view)
         
         self.task_view.set_sub_button_state('disable') 
 
@@ -118,10 +124,13 @@ class TaskController:
         self.view_panel.insert_text(task.template)
     
     def bind_task_events(self):
-        self.main_window.bind_all('<<Save'+self.task_name+'Script>>', lambda _ : self._on_save_button(self.task, self.task_view))
-        self.main_window.bind_all('<<SubLocal'+self.task_name+'>>', self._on_run_local_button)
-        self.main_window.bind_all('<<SubNetwork'+self.task_name+'>>', self._on_run_network_button)
+        self.app.bind_event(actions.SAVE_SCRIPT[self.task_name], self._on_save_current, widget=self.task_view)
+        self.app.bind_event(actions.SUB_LOCAL[self.task_name], self._on_run_local_button, widget=self.task_view)
+        self.app.bind_event(actions.SUB_NETWORK[self.task_name], self._on_run_network_button, widget=self.task_view)
     
+    def _on_save_current(self, *_):
+        self._on_save_button(self.task, self.task_view)
+
     def _on_save_button(self, task:Task, view, *_):
         template = self.view_panel.get_text()
         self.engine = self.workflow_manager.engine
@@ -482,14 +491,36 @@ class TaskController:
                 return
 
         self.task.set_submit_local()
-        
-        try:
-            self.task.run_job_local(cmd)
-        except FileNotFoundError as e:
-            messagebox.showerror(title='yes',message=e)
+
+        # Only the engine run happens on the worker thread; every dialog and
+        # widget update stays on the Tk thread via _poll_local_job.
+        outcome = {}
+        def job():
+            try:
+                self.task.run_job_local(cmd)
+            except Exception as e:
+                outcome['error'] = e
+
+        if self.job_sub_page is not None:
+            self.job_sub_page.start_submit_thread(job)
+            thread = self.job_sub_page.submit_thread
+        else:
+            thread = threading.Thread(target=job, daemon=True)
+            thread.start()
+        self._poll_local_job(thread, outcome)
+
+    def _poll_local_job(self, thread, outcome):
+        if thread.is_alive():
+            self.main_window.after(100, self._poll_local_job, thread, outcome)
             return
-        except Exception as e:
-            messagebox.showerror(title = "Error",message=f'There was an error when trying to run the job', detail = f'{e}')
+        self._on_local_job_done(outcome.get('error'))
+
+    def _on_local_job_done(self, error=None):
+        if isinstance(error, FileNotFoundError):
+            messagebox.showerror(title='yes',message=error)
+            return
+        if error is not None:
+            messagebox.showerror(title = "Error",message=f'There was an error when trying to run the job', detail = f'{error}')
             return
         if self.task.task_info.job_info.job_returncode != 0:
             messagebox.showerror(title = "Error",message=f"Job exited with non-zero return code.", detail = f" Error: {self.task.task_info.job_info.error}")
@@ -543,9 +574,16 @@ class TaskController:
         
         login_dict = self.job_sub_page.get_network_dict()
         update_remote_profile_list(login_dict)
-        
+
+        self.app.run_net_job(lambda: self._do_network_submit(self.task, login_dict, cmd),
+                            self._on_network_submit_done,
+                            start=self.job_sub_page.start_submit_thread)
+
+    @staticmethod
+    def _do_network_submit(task, login_dict, cmd):
+        """Connects and submits the job; runs on a worker thread."""
         try:
-            self.task.connect_to_network(hostname=login_dict['ip'],
+            task.connect_to_network(hostname=login_dict['ip'],
                                     username=login_dict['username'],
                                     password=login_dict['password'],
                                     pkey_file=login_dict['pkey_file'],
@@ -553,13 +591,15 @@ class TaskController:
                                     remote_path=login_dict['remote_path'],
                                     passwordless_ssh=login_dict['passwordless_ssh'])
         except Exception as e:
-            messagebox.showerror(title = "Error", message = 'Unable to connect to the network', detail= e)
-            self.job_sub_page.set_run_button_state('active')
-            return
-        try:
-            self.task.submit_network.run_job(cmd)
-        except Exception as e:
-            messagebox.showerror(title = "Error",message=f'There was an error when trying to run the job', detail = f'{e}')
+            raise _ConnectFailed(e) from e
+        task.submit_network.run_job(cmd)
+
+    def _on_network_submit_done(self, status, payload):
+        if status == 'err':
+            if isinstance(payload, _ConnectFailed):
+                messagebox.showerror(title = "Error", message = 'Unable to connect to the network', detail= payload.__cause__)
+            else:
+                messagebox.showerror(title = "Error",message=f'There was an error when trying to run the job', detail = f'{payload}')
             self.job_sub_page.set_run_button_state('active')
             return
         if self.task.task_info.job_info.submit_returncode != 0:
@@ -610,11 +650,24 @@ class TaskController:
                                 detail = f"output:{self.task.task_info.job_info.submit_output}")
             return
 
-        print("Checking for job completion..")
-        if self.task.submit_network.check_job_status():
-
-            print('job Done.')
-            self._get_remote_output()   
+        # The status check and the downloads are SSH round trips, so they run
+        # on a worker thread, see GUIAPP.run_net_job.
+        self.app.log_panel.log_message("Checking for job completion..", 'info')
+        self.app.run_net_job(self._check_remote_job, self._on_remote_job_checked)
+
+    def _check_remote_job(self):
+        """Returns whether the remote job is done, downloading its output if so."""
+        done = self.task.submit_network.check_job_status()
+        if done:
+            self._get_remote_output()
+        return done
+
+    def _on_remote_job_checked(self, status, payload):
+        if status == 'err':
+            messagebox.showerror(title = "Error", message="Unable to check the job status.", detail = f'{payload}')
+            return
+        if payload:
+            self.app.log_panel.log_message('job Done.', 'info')
             log_txt = self.task.get_engine_log()
             self.view_panel.insert_text(log_txt, 'disabled')
             self.task_info.state.calculation = True
@@ -623,11 +676,14 @@ class TaskController:
             get = messagebox.askyesno(title='Info', message="Job not commpleted.", detail= "Do you what to download engine log file?")
 
             if get:
-                self.task.submit_network.get_output_log()
-                log_txt = self.task.get_engine_log()
-                self.view_panel.insert_text(log_txt, 'disabled')
-            else:
-                return
+                self.app.run_net_job(self.task.submit_network.get_output_log, self._on_remote_log_downloaded)
+
+    def _on_remote_log_downloaded(self, status, payload):
+        if status == 'err':
+            messagebox.showerror(title = "Error", message="Unable to download the engine log file.", detail = f'{payload}')
+            return
+        log_txt = self.task.get_engine_log()
+        self.view_panel.insert_text(log_txt, 'disabled')
 
 class PostProcessTaskController(TaskController):
 
@@ -32,10 +32,8 @@ def update_proj_list(project: Path) -> None:
     if not proj:
         proj  = project.name + '\t' + str(project) + '\t'+ cur_time + '\n'
 
-    with open(project_list_file , 'w+') as wf:   
-        proj_list.insert(0, proj)
-        for line in proj_list:
-            wf.write(line)
+    proj_list.insert(0, proj)
+    project_list_file.write_text(''.join(proj_list))
 
         
 def update_remote_profile_list(profile: dict) -> None:
@@ -56,9 +54,7 @@ def update_remote_profile_list(profile: dict) -> None:
     else:
         profile_list.insert(0, line)
 
-    with open(remote_machine_profile , 'w+') as wf:   
-        for line in profile_list:
-            wf.write(line)
+    remote_machine_profile.write_text(''.join(profile_list))
 
 def get_remote_profile() -> dict:
 
@@ -3,20 +3,53 @@ import tkinter as tk
 class ViewPanelManager:
     def __init__(self, app):
         self.app = app
-        builder = self.app.builder
-        self.view_txt = builder.get_object('view_text')
+        self.view_txt = app.get_object('view_text')
+        # Latest (text, state) passed to insert_text, written once Tk is idle.
+        self._pending_text = None
+        self._flush_id = None
+        # What get_text would return, while the user has not edited the panel.
+        self._text_mirror = None
+        self.view_txt.bind('<<Modified>>', self._on_modified, add='+')
+
+    def _on_modified(self, *_):
+        if self.view_txt.edit_modified():
+            self._text_mirror = None
+
+    def _set_mirror(self, text):
+        # Tk keeps a newline after the last character of a Text widget.
+        self._text_mirror = text + '\n' if isinstance(text, str) else None
+        self.view_txt.edit_modified(False)
 
     def clear_text(self):
+        self._pending_text = None
         self.view_txt.delete("1.0", tk.END)
+        # A disabled Text ignores delete, so read the widget next time.
+        self._text_mirror = None
 
     def insert_text(self, text, state='normal'):
+        """Replaces the panel text. Back-to-back calls are coalesced into one
+        widget update when Tk is next idle."""
+        self._pending_text = (text, state)
+        if self._flush_id is None:
+            self._flush_id = self.view_txt.after_idle(self._flush_text)
+
+    def _flush_text(self):
+        self._flush_id = None
+        if self._pending_text is None:
+            return
+        text, state = self._pending_text
+        self._pending_text = None
         self.view_txt.configure(state='normal')
-        self.clear_text()
-        
+        self.view_txt.delete("1.0", tk.END)
+
         self.view_txt.insert(tk.END, text)
         self.view_txt.configure(state=state)
+        self._set_mirror(text)
 
     def get_text(self):
+        self._flush_text()
+        if self._text_mirror is not None:
+            return self._text_mirror
         txt = self.view_txt.get(1.0, tk.END)
         return txt
-       
+
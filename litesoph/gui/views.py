@@ -444,7 +444,7 @@ class PlotSpectraPage(View):
         self.Frame3 = ttk.Frame(parent, borderwidth=2, relief='groove')
         self.Frame3.grid(row=r, column=c, sticky='nswe')
 
-        self.submit_button = tk.Button(self.Frame3, text="Submit Local", activebackground="#78d6ff",command=lambda: self.event_generate('<<SubLocal'+task_name+'>>'))
+        self.submit_button = tk.Button(self.Frame3, text="Submit Local", activebackground="#78d6ff",command=lambda: self.event_generate(actions.SUB_LOCAL[task_name]))
         self.submit_button['font'] = myfont()
         self.submit_button.grid(row=1, column=2,padx=3, pady=6, sticky='nsew')
         
@@ -601,11 +601,11 @@ class TcmPage(View):
         # self.Frame3 = ttk.Frame(self, borderwidth=2, relief='groove')
         # self.Frame3.grid(row=1, column=1, sticky='nswe')
         
-        self.submit_button = tk.Button(parent, text="Submit Local", activebackground="#78d6ff", command=lambda: self.event_generate('<<SubLocal'+task_name+'>>'))
+        self.submit_button = tk.Button(parent, text="Submit Local", activebackground="#78d6ff", command=lambda: self.event_generate(actions.SUB_LOCAL[task_name]))
         self.submit_button['font'] =myfont()
         self.submit_button.grid(row=1, column=2,padx=3, pady=6, sticky='nsew')
         
-        self.Frame1_Button3 = tk.Button(parent, text="Submit Network", activebackground="#78d6ff", command=lambda: self.event_generate('<<SubNetwork'+task_name+'>>'))
+        self.Frame1_Button3 = tk.Button(parent, text="Submit Network", activebackground="#78d6ff", command=lambda: self.event_generate(actions.SUB_NETWORK[task_name]))
         self.Frame1_Button3['font'] = myfont()
         self.Frame1_Button3.grid(row=2, column=2, padx=3, pady=6, sticky='nsew')    
 
@@ -769,7 +769,7 @@ class PopulationPage(View):
         # add_job_frame(self, self.SubFrame3,self.task_name, row= 0, column=1)
 
     def _on_submit(self):
-        self.event_generate(f"<<SubLocal{self.task_name}>>")
+        self.event_generate(actions.SUB_LOCAL[self.task_name])
 
     def _on_plot(self):
         self.event_generate(f"<<Plot{self.task_name}>>")
@@ -1134,7 +1134,7 @@ class JobSubPage(ttk.Frame):
         self.save_job_button['font'] = myfont()
         self.save_job_button.grid(row=6,column=1,sticky='nsew', padx=2, pady=4)        
         
-        self.run_button = tk.Button(self.sub_job_frame, text="Run Job",activebackground="#78d6ff",command= lambda:self.start_submit_thread(submit_job))
+        self.run_button = tk.Button(self.sub_job_frame, text="Run Job",activebackground="#78d6ff",command= submit_job)
         self.run_button['font'] = myfont()
         self.run_button.grid(row=7, column=0,sticky='nsew', pady=5)   
         
@@ -1245,7 +1245,7 @@ class JobSubPage(ttk.Frame):
         self.save_job_button['font'] = myfont()
         self.save_job_button.grid(row=12,column=1,sticky='nsew', padx=2, pady=4)
 
-        self.run_button = tk.Button(self.sub_job_frame, text="Run Job",activebackground="#78d6ff", command= lambda:self.start_submit_thread(submit_job))
+        self.run_button = tk.Button(self.sub_job_frame, text="Run Job",activebackground="#78d6ff", command= submit_job)
         self.run_button['font'] = myfont()
         self.run_button.grid(row=13,column=0,sticky='nsew', padx=2, pady=4)  
 
@@ -1505,10 +1505,10 @@ class GroundStatePage(View):
         self.event_generate(f'<<Clear{self.task_name}Script>>')
     
     def generate_input_button(self):
-        self.event_generate(f'<<Generate{self.task_name}Script>>')
+        self.event_generate(actions.GENERATE_SCRIPT[self.task_name])
 
     def save_button(self):
-        self.event_generate('<<Save'+self.task_name+'Script>>')  
+        self.event_generate(actions.SAVE_SCRIPT[self.task_name])  
 
     #---------------------------------View Specific trace functions----------------------------------------------------------------    
 
@@ -1708,10 +1708,10 @@ class TimeDependentPage(View):
                         ignore_state=False,var_values=default_gui_dict)
     
     def generate_input_button(self):
-        self.event_generate(f'<<Generate{self.task_name}Script>>')
+        self.event_generate(actions.GENERATE_SCRIPT[self.task_name])
 
     def save_button(self):
-        self.event_generate('<<Save'+self.task_name+'Script>>')    
+        self.event_generate(actions.SAVE_SCRIPT[self.task_name])    
 
 class PumpProbePostProcessPage(View):
     
@@ -1,27 +1,21 @@
 import numpy as np
 
 def extract_pop_window(data, popl_file, homo_index, below_homo, above_lumo):
-        pop_data = []
+        data = np.asarray(data)
         homo_index += 1
-        for row in data:
-            pop = [row[0]]
-            pop.extend(row[homo_index - below_homo: homo_index+ above_lumo])
-            pop_data.append(pop)
-            
-        pop_data = np.array(pop_data)
+        pop_data = np.column_stack((data[:, 0], data[:, homo_index - below_homo: homo_index+ above_lumo]))
         np.savetxt(popl_file, pop_data)
 
 def get_occ_unocc(data, energy_col=2, occupancy_col=1):
-    occ = []
-    unocc = []
-    
-    for row in data:
-        if row[occupancy_col] == 2.0 or row[occupancy_col] == 1.0:
-            occ.append(row[energy_col])
-        elif row[occupancy_col] == 0.0:
-            unocc.append(row[energy_col])
-        
-    return occ, unocc
+    data = np.asarray(data)
+    if data.size == 0:
+        return [], []
+
+    occupancy = data[:, occupancy_col]
+    energy = data[:, energy_col]
+    occ = energy[(occupancy == 2.0) | (occupancy == 1.0)]
+    unocc = energy[occupancy == 0.0]
+    return occ.tolist(), unocc.tolist()
 
 def get_energy_window(data,energy_file, below_homo, above_lumo):
     
@@ -36,9 +30,7 @@ def calc_population_diff(homo_index:int, infile, outfile):
     """ Calculates and writes change in population of KS states from population file"""
     
     data = np.loadtxt(infile)
-    time_array = data[:,0]
-    for i in range(homo_index):
-        data[:,i+1] = data[:,i+1]-2
+    data[:, 1:homo_index+1] -= 2
     np.savetxt(outfile, data)
 
 def create_states_index(num_below_homo:int,num_above_lumo:int, homo_index:int):
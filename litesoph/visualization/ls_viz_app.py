@@ -13,7 +13,7 @@ from tkinter import *
 
 def create_directory(directory):
         absdir = os.path.abspath(directory)
-        if absdir != Path.cwd and not Path.is_dir(directory):
+        if absdir != Path.cwd and not os.path.isdir(absdir):
             os.makedirs(directory)
 
 def python_list_to_tcl_list(py_list):
@@ -534,7 +534,7 @@ class CubeFilePlot(CommonGraphParam):
 
             # Set the frame rate and number of frames
             frame_rate = 24
-            num_frames = len(list(Path(input_dir).glob('*.png')))
+            num_frames = sum(1 for _ in Path(input_dir).glob('*.png'))
 
             # Set the render settings
             bpy.context.scene.render.resolution_x = 1920
@@ -591,10 +591,8 @@ class CubeFilePlot(CommonGraphParam):
     def _on_generate_cube_plot_matplotlib(self):
         
         ims=[]
-        list_imgs = list(Path(self.traj_dir).glob('*.png'))
-        
-        for i in range(len(list_imgs)):           
-            img = mpimg.imread(list_imgs[i])
+        for i, img_path in enumerate(Path(self.traj_dir).glob('*.png')):
+            img = mpimg.imread(img_path)
             plt.axis('off')
             im = plt.imshow(img)
             if i == 0:
@@ -180,7 +180,7 @@ def get_spectrums_delays(task_info,dependent_tasks,project_dir,only_workflow_dir
             spectrum_data_list.append(spec_file)
         return delay_list,spectrum_data_list
 
-def prepare_tas_data(spectrum_data_list,delay_list,contour_x_data_file,contour_y_data_file,contour_z_data_file):        
+def prepare_tas_data(spectrum_data_list,delay_list,contour_x_data_file,contour_y_data_file,contour_z_data_file, save_npy=False):        
         
         data0=np.loadtxt(spectrum_data_list[0], comments="#")
         Omega = data0[:,0]
@@ -202,3 +202,8 @@ def prepare_tas_data(spectrum_data_list,delay_list,contour_x_data_file,contour_y
         np.savetxt(contour_x_data_file, x_data, fmt=fmt)  
         np.savetxt(contour_y_data_file, y_data, fmt=fmt)  
         np.savetxt(contour_z_data_file, z_data, fmt=fmt)  
+
+        if save_npy:
+            # Binary siblings let the plot step skip re-parsing the text grids.
+            for fname, arr in ((contour_x_data_file, x_data), (contour_y_data_file, y_data), (contour_z_data_file, z_data)):
+                np.save(Path(fname).with_suffix('.npy'), arr)
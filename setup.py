@@ -17,7 +17,7 @@ requirements = [
 
 setup_requirements = []
 
-txt = Path('litesoph/__init__.py').read_text()
+txt = Path('litesoph/version.py').read_text()
 version = re.search("__version__ = '(.*)'", txt).group(1)
 
 setup(name = 'litesoph',